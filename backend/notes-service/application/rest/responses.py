@@ -0,0 +1,128 @@
+"""Response classes for the shared notes REST API.
+
+This module contains the JSON response classes used by every router. Handlers
+return them directly with their response schema, which skips FastAPI's
+``jsonable_encoder`` pass and serializes with orjson or pydantic-core.
+"""
+
+from typing import Any, AsyncIterator, Iterable
+
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+# Encoded rows are buffered up to this size before a body chunk is sent
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _serialize_default(obj: Any) -> Any:
+    """Convert values orjson cannot encode natively.
+
+    Args:
+        obj (Any): Value orjson could not serialize.
+
+    Returns:
+        Any: A structure of natively serializable values.
+
+    Raises:
+        TypeError: If the value type is not supported.
+    """
+    if isinstance(obj, BaseModel):
+        # UUIDs and datetimes are left to orjson's native encoders
+        return obj.model_dump()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson.
+
+    Accepts Pydantic models (also nested in lists/dicts) besides plain JSON
+    data, so handlers can pass their response schema as-is. A top-level model
+    is encoded by its own compiled pydantic-core serializer straight to bytes,
+    without building intermediate dicts.
+
+    Example:
+        >>> return ORJSONResponse(NoteResponse.from_entity(note))
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes.
+
+        Args:
+            content (Any): Response payload.
+
+        Returns:
+            bytes: The encoded JSON body.
+        """
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(
+            content, default=_serialize_default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+
+async def _iter_page_json(
+    items_key: str, rows: Iterable[Any], pagination: BaseModel
+) -> AsyncIterator[bytes]:
+    """Encode a paginated list payload row by row.
+
+    Args:
+        items_key (str): Key of the list of rows in the payload.
+        rows (Iterable[Any]): Rows of the current page, converted lazily.
+        pagination (BaseModel): Pagination metadata of the page.
+
+    Yields:
+        bytes: Body chunks of about STREAM_CHUNK_SIZE bytes.
+    """
+    buffer = bytearray(b"{")
+    buffer += orjson.dumps(items_key)
+    buffer += b":["
+    separator = b""
+    for row in rows:
+        buffer += separator
+        buffer += orjson.dumps(
+            row, default=_serialize_default, option=orjson.OPT_NON_STR_KEYS
+        )
+        separator = b","
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b'],"pagination":'
+    buffer += pagination.__pydantic_serializer__.to_json(pagination)
+    buffer += b"}"
+    yield bytes(buffer)
+
+
+class ORJSONPageResponse(StreamingResponse):
+    """Streamed JSON response for a page of list rows.
+
+    Rows are encoded one at a time and flushed in chunks, so a page with
+    large note contents is never held as a single body in memory and the
+    first bytes go out before the last row is encoded.
+
+    Example:
+        >>> return ORJSONPageResponse("notes", rows, pagination_info)
+    """
+
+    def __init__(
+        self,
+        items_key: str,
+        rows: Iterable[Any],
+        pagination: BaseModel,
+        status_code: int = 200,
+    ) -> None:
+        """Initialize the response.
+
+        Args:
+            items_key (str): Key of the list of rows in the payload.
+            rows (Iterable[Any]): Rows of the current page.
+            pagination (BaseModel): Pagination metadata of the page.
+            status_code (int, optional): HTTP status code. Defaults to 200.
+        """
+        super().__init__(
+            _iter_page_json(items_key, rows, pagination),
+            status_code=status_code,
+            media_type=ORJSONResponse.media_type,
+        )
@@ -4,24 +4,22 @@ This module contains the FastAPI router for note operations.
 
 import logging
 import uuid
-from typing import Optional
+from typing import List, Optional
 from uuid import UUID
 
+from application.rest.responses import ORJSONPageResponse, ORJSONResponse
 from application.rest.schemas.input.note_input import NoteCreate, NoteUpdate
 from application.rest.schemas.input.share_input import ShareRequest
 from application.rest.schemas.output.common_output import ErrorResponse
 from application.rest.schemas.output.note_output import (
     NoteResponse,
     NotesListResponse,
-    PaginationInfo,
-)
-from application.rest.schemas.output.share_output import (
-    NoteSharesResponse,
-    ShareResponse,
 )
+from application.rest.schemas.output.share_output import NoteSharesResponse
+from domain.entities.share import NoteShare
 from domain.services.note_service import NoteError, NoteNotFoundError, NoteService
 from domain.services.tag_service import TagService
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 from utils.dependencies import (
     get_current_user_id,
@@ -29,10 +27,31 @@ from utils.dependencies import (
     get_note_service,
     get_tag_service,
 )
-from utils.keycloak import get_user_email_by_id, get_user_id_by_email
+from utils.keycloak import get_user_emails_by_ids, get_user_id_by_email
 
 logger = logging.getLogger(__name__)
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+
+async def _add_share_emails(shares_data: List[NoteShare]) -> List[dict]:
+    """Build share dictionaries enriched with recipient emails from Keycloak.
+
+    All emails are fetched in one batch that shares a single Keycloak admin
+    token and HTTP client.
+
+    Args:
+        shares_data (List[NoteShare]): Shares from the note service.
+
+    Returns:
+        List[dict]: Share dictionaries with an added "shared_with_email" key.
+    """
+    emails = await get_user_emails_by_ids(
+        [share.shared_with_user_id for share in shares_data]
+    )
+    return [
+        {**share._asdict(), "shared_with_email": email or "Email not found"}
+        for share, email in zip(shares_data, emails)
+    ]
 
 
 @router.get(
@@ -62,7 +81,7 @@ router = APIRouter()
     },
 )
 async def get_notes(
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     page: int = 1,
     limit: int = 10,
     tag_ids: Optional[str] = None,
@@ -72,7 +91,7 @@ async def get_notes(
     """Retrieve all notes for the current user with pagination support.
 
     Args:
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         page (int, optional): Page number for pagination. Defaults to 1.
         limit (int, optional): Number of notes per page. Defaults to 10.
         tag_ids (Optional[str], optional): Comma-separated tag UUIDs for filtering. Defaults to None.
@@ -87,12 +106,11 @@ async def get_notes(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> result = await get_notes(request)
+        >>> result = await get_notes(user_id)
         >>> print(f"Total notes: {len(result.notes)}")
         Total notes: 5
     """
     try:
-        user_id = get_current_user_id(request)
         logger.info(
             f"Getting notes for user_id: {user_id}, page: {page}, limit: {limit}"
         )
@@ -109,15 +127,10 @@ async def get_notes(
             db, user_id, page, limit, tag_uuids
         )
 
-        note_responses = [NoteResponse.from_entity(note) for note in notes]
-
-        response = NotesListResponse(
-            notes=note_responses,
-            pagination=PaginationInfo.from_entity(pagination),
-        )
+        rows, pagination_info = NotesListResponse.page_parts(notes, pagination)
 
-        logger.info(f"Returning {len(note_responses)} notes for user {user_id}")
-        return response
+        logger.info(f"Returning {len(notes)} notes for user {user_id}")
+        return ORJSONPageResponse("notes", rows, pagination_info)
 
     except ValueError as e:
         logger.warning(f"Invalid request parameters: {str(e)}")
@@ -161,7 +174,7 @@ async def get_notes(
     },
 )
 async def get_my_notes(
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     page: int = 1,
     limit: int = 15,
     tags: Optional[str] = None,  # Comma-separated tag IDs for filtering
@@ -171,7 +184,7 @@ async def get_my_notes(
     """Get paginated list of user's own notes that are NOT shared with others.
 
     Args:
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         page (int, optional): Page number for pagination. Defaults to 1.
         limit (int, optional): Number of notes per page. Defaults to 15.
         tags (Optional[str], optional): Comma-separated tag UUIDs for filtering. Defaults to None.
@@ -187,11 +200,10 @@ async def get_my_notes(
         HTTPException: 500 for internal server errors.
 
     Example:
-        >>> result = await get_my_notes(request, tags="uuid1,uuid2")
+        >>> result = await get_my_notes(user_id, tags="uuid1,uuid2")
         >>> print(f"Private notes: {len(result.notes)}")
         Private notes: 3
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Getting my notes for user {user_id}, page {page}, limit {limit}")
 
     try:
@@ -218,15 +230,10 @@ async def get_my_notes(
             tag_ids=tag_ids,
         )
 
-        note_responses = [NoteResponse.from_entity(note) for note in notes]
-
-        response = NotesListResponse(
-            notes=note_responses,
-            pagination=PaginationInfo.from_entity(pagination),
-        )
+        rows, pagination_info = NotesListResponse.page_parts(notes, pagination)
 
-        logger.info(f"Returning {len(note_responses)} my notes for user {user_id}")
-        return response
+        logger.info(f"Returning {len(notes)} my notes for user {user_id}")
+        return ORJSONPageResponse("notes", rows, pagination_info)
 
     except ValueError as e:
         logger.warning(f"Invalid request parameters: {str(e)}")
@@ -270,7 +277,7 @@ async def get_my_notes(
     },
 )
 async def get_notes_shared_by_me(
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     page: int = 1,
     limit: int = 15,
     tags: Optional[str] = None,  # Comma-separated tag IDs for filtering
@@ -280,7 +287,7 @@ async def get_notes_shared_by_me(
     """Get notes owned by user that ARE shared with others.
 
     Args:
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         page (int, optional): Page number for pagination. Defaults to 1.
         limit (int, optional): Number of notes per page. Defaults to 15.
         tags (Optional[str], optional): Comma-separated tag UUIDs for filtering. Defaults to None.
@@ -296,11 +303,10 @@ async def get_notes_shared_by_me(
         HTTPException: 500 for internal server errors.
 
     Example:
-        >>> result = await get_notes_shared_by_me(request)
+        >>> result = await get_notes_shared_by_me(user_id)
         >>> print(f"Shared by me: {result.pagination.total_notes}")
         Shared by me: 7
     """
-    user_id = get_current_user_id(request)
     logger.info(
         f"Getting notes shared by me for user {user_id}, page {page}, limit {limit}"
     )
@@ -329,15 +335,10 @@ async def get_notes_shared_by_me(
             tag_ids=tag_ids,
         )
 
-        note_responses = [NoteResponse.from_entity(note) for note in notes]
+        rows, pagination_info = NotesListResponse.page_parts(notes, pagination)
 
-        response = NotesListResponse(
-            notes=note_responses,
-            pagination=PaginationInfo.from_entity(pagination),
-        )
-
-        logger.info(f"Returning {len(note_responses)} notes shared by me")
-        return response
+        logger.info(f"Returning {len(notes)} notes shared by me")
+        return ORJSONPageResponse("notes", rows, pagination_info)
 
     except ValueError as e:
         logger.warning(f"Invalid request parameters: {str(e)}")
@@ -381,7 +382,7 @@ async def get_notes_shared_by_me(
     },
 )
 async def get_notes_shared_with_me(
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     page: int = 1,
     limit: int = 15,
     tags: Optional[str] = None,  # Comma-separated tag IDs for filtering
@@ -391,7 +392,7 @@ async def get_notes_shared_with_me(
     """Get notes shared WITH the current user (not owned by them).
 
     Args:
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         page (int, optional): Page number for pagination. Defaults to 1.
         limit (int, optional): Number of notes per page. Defaults to 15.
         tags (Optional[str], optional): Comma-separated tag UUIDs for filtering. Defaults to None.
@@ -407,11 +408,10 @@ async def get_notes_shared_with_me(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> result = await get_notes_shared_with_me(request)
+        >>> result = await get_notes_shared_with_me(user_id)
         >>> print(f"Shared with me: {result.pagination.total_notes}")
         Shared with me: 3
     """
-    user_id = get_current_user_id(request)
     logger.info(
         f"Getting notes shared with me for user {user_id}, page {page}, limit {limit}"
     )
@@ -440,15 +440,10 @@ async def get_notes_shared_with_me(
             tag_ids=tag_ids,
         )
 
-        note_responses = [NoteResponse.from_entity(note) for note in notes]
-
-        response = NotesListResponse(
-            notes=note_responses,
-            pagination=PaginationInfo.from_entity(pagination),
-        )
+        rows, pagination_info = NotesListResponse.page_parts(notes, pagination)
 
-        logger.info(f"Returning {len(note_responses)} notes shared with me")
-        return response
+        logger.info(f"Returning {len(notes)} notes shared with me")
+        return ORJSONPageResponse("notes", rows, pagination_info)
 
     except ValueError as e:
         logger.warning(f"Invalid request parameters: {str(e)}")
@@ -473,13 +468,6 @@ async def get_notes_shared_with_me(
             "model": NoteResponse,
             "description": "Note details retrieved successfully.",
         },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorResponse,
-            "description": "Invalid note ID format.",
-            "content": {
-                "application/json": {"example": {"detail": "Invalid note ID format."}}
-            },
-        },
         status.HTTP_401_UNAUTHORIZED: {
             "model": ErrorResponse,
             "description": "User authentication required.",
@@ -511,16 +499,16 @@ async def get_notes_shared_with_me(
     },
 )
 async def get_note(
-    note_id: str,
-    request: Request,
+    note_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
 ):
     """Get a specific note by ID.
 
     Args:
-        note_id (str): UUID of the note to retrieve.
-        request (Request): FastAPI request object containing user headers.
+        note_id (UUID): UUID of the note to retrieve.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
 
@@ -533,30 +521,23 @@ async def get_note(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> note = await get_note("uuid-123", request)
+        >>> note = await get_note("uuid-123", user_id)
         >>> print(note.title)
         "My Important Note"
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Getting note {note_id} for user {user_id}")
 
     try:
-        # Parse note UUID
-        try:
-            note_uuid = uuid.UUID(note_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid note ID format")
-
         # Use domain service to get note
         note = await note_service.get_note(
             db_session=db,
-            note_id=note_uuid,
+            note_id=note_id,
             user_id=user_id,
         )
 
         response = NoteResponse.from_entity(note)
         logger.info(f"Retrieved note {note_id} successfully")
-        return response
+        return ORJSONResponse(response)
 
     except NoteNotFoundError as e:
         logger.warning(f"Note not found: {str(e)}")
@@ -612,7 +593,7 @@ async def get_note(
 )
 async def create_note(
     note: NoteCreate,
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
     tag_service: TagService = Depends(get_tag_service),
@@ -621,7 +602,7 @@ async def create_note(
 
     Args:
         note (NoteCreate): Note creation data including title, content, tags, and share emails.
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
         tag_service (TagService): Domain service for tag operations.
@@ -636,11 +617,10 @@ async def create_note(
 
     Example:
         >>> note_data = NoteCreate(title="Work Note", content="Important task", tags=["uuid1"])
-        >>> created = await create_note(note_data, request)
+        >>> created = await create_note(note_data, user_id)
         >>> print(created.id)
         "uuid-new-note"
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Creating note for user {user_id}")
     logger.info(
         f"Note data: title='{note.title}', content length={len(note.content)}, tags={note.tags}, share_emails={note.share_emails}"
@@ -724,7 +704,7 @@ async def create_note(
 
         response = NoteResponse.from_entity(created_note)
         logger.info(f"Successfully created note {created_note.id}")
-        return response
+        return ORJSONResponse(response, status_code=status.HTTP_201_CREATED)
 
     except HTTPException:
         raise
@@ -754,10 +734,8 @@ async def create_note(
         },
         status.HTTP_400_BAD_REQUEST: {
             "model": ErrorResponse,
-            "description": "Invalid request data or note ID format.",
-            "content": {
-                "application/json": {"example": {"detail": "Invalid note ID format."}}
-            },
+            "description": "Invalid request data.",
+            "content": {"application/json": {"example": {"detail": "Tags not found."}}},
         },
         status.HTTP_401_UNAUTHORIZED: {
             "model": ErrorResponse,
@@ -790,9 +768,9 @@ async def create_note(
     },
 )
 async def update_note(
-    note_id: str,
+    note_id: UUID,
     note_update: NoteUpdate,
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
     tag_service: TagService = Depends(get_tag_service),
@@ -800,9 +778,9 @@ async def update_note(
     """Update an existing note.
 
     Args:
-        note_id (str): UUID of the note to update.
+        note_id (UUID): UUID of the note to update.
         note_update (NoteUpdate): Updated note data with optional title, content, and tags.
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
         tag_service (TagService): Domain service for tag operations.
@@ -817,20 +795,13 @@ async def update_note(
 
     Example:
         >>> update_data = NoteUpdate(title="Updated Title")
-        >>> updated = await update_note("uuid-123", update_data, request)
+        >>> updated = await update_note("uuid-123", update_data, user_id)
         >>> print(updated.title)
         "Updated Title"
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Updating note {note_id} for user {user_id}")
 
     try:
-        # Parse note UUID
-        try:
-            note_uuid = uuid.UUID(note_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid note ID format")
-
         # Convert tag IDs to tag entities if provided
         tag_entities = None
         if note_update.tags is not None:
@@ -853,7 +824,7 @@ async def update_note(
         # Use domain service to update note
         updated_note = await note_service.update_note(
             db_session=db,
-            note_id=note_uuid,
+            note_id=note_id,
             user_id=user_id,
             title=note_update.title,
             content=note_update.content,
@@ -862,7 +833,7 @@ async def update_note(
 
         response = NoteResponse.from_entity(updated_note)
         logger.info(f"Successfully updated note {note_id}")
-        return response
+        return ORJSONResponse(response)
 
     except NoteNotFoundError as e:
         logger.warning(f"Note not found: {str(e)}")
@@ -892,13 +863,6 @@ async def update_note(
         status.HTTP_204_NO_CONTENT: {
             "description": "Note deleted successfully.",
         },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorResponse,
-            "description": "Invalid note ID format.",
-            "content": {
-                "application/json": {"example": {"detail": "Invalid note ID format."}}
-            },
-        },
         status.HTTP_401_UNAUTHORIZED: {
             "model": ErrorResponse,
             "description": "User authentication required.",
@@ -930,21 +894,21 @@ async def update_note(
     },
 )
 async def delete_note(
-    note_id: str,
-    request: Request,
+    note_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
-):
+) -> Response:
     """Delete a note (soft delete).
 
     Args:
-        note_id (str): UUID of the note to delete.
-        request (Request): FastAPI request object containing user headers.
+        note_id (UUID): UUID of the note to delete.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
 
     Returns:
-        dict: Success message confirming deletion.
+        Response: Empty 204 No Content response.
 
     Raises:
         HTTPException: 401 if user ID not found in headers.
@@ -952,30 +916,23 @@ async def delete_note(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> result = await delete_note("uuid-123", request)
-        >>> print(result["message"])
-        "Note deleted successfully"
+        >>> result = await delete_note("uuid-123", user_id)
+        >>> print(result.status_code)
+        204
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Deleting note {note_id} for user {user_id}")
 
     try:
-        # Parse note UUID
-        try:
-            note_uuid = uuid.UUID(note_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid note ID format")
-
         # Use domain service to delete note
         success = await note_service.delete_note(
             db_session=db,
-            note_id=note_uuid,
+            note_id=note_id,
             user_id=user_id,
         )
 
         if success:
             logger.info(f"Successfully deleted note {note_id}")
-            return {"message": "Note deleted successfully"}
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
         else:
             logger.warning(f"Failed to delete note {note_id}")
             raise HTTPException(status_code=500, detail="Failed to delete note")
@@ -1013,7 +970,7 @@ async def delete_note(
         },
         status.HTTP_400_BAD_REQUEST: {
             "model": ErrorResponse,
-            "description": "Invalid request data - invalid note ID, empty email list, or user not found.",
+            "description": "Invalid request data - empty email list or user not found.",
             "content": {
                 "application/json": {
                     "example": {"detail": "Invalid email addresses provided."}
@@ -1060,18 +1017,18 @@ async def delete_note(
     },
 )
 async def share_note(
-    note_id: str,
+    note_id: UUID,
     share_request: ShareRequest,
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
 ):
     """Share a note with one or more users by email.
 
     Args:
-        note_id (str): UUID of the note to share.
+        note_id (UUID): UUID of the note to share.
         share_request (ShareRequest): Request containing note ID and list of emails to share with.
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
 
@@ -1086,22 +1043,15 @@ async def share_note(
 
     Example:
         >>> share_req = ShareRequest(note_id="uuid-123", emails=["user@email.com"])
-        >>> shares = await share_note("uuid-123", share_req, request)
+        >>> shares = await share_note("uuid-123", share_req, user_id)
         >>> print(len(shares.shares))
         1
     """
-    user_id = get_current_user_id(request)
     logger.info(
         f"Sharing note {note_id} for user {user_id} with {len(share_request.emails)} recipients"
     )
 
     try:
-        # Parse note UUID
-        try:
-            note_uuid = uuid.UUID(note_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid note ID format")
-
         # Validate that note_id in request matches URL parameter
         if share_request.note_id != note_id:
             raise HTTPException(status_code=400, detail="Note ID mismatch")
@@ -1116,49 +1066,29 @@ async def share_note(
                 )
             validated_user_ids.append(shared_with_user_id)
 
-        # Share note with each validated user using domain service
-        for shared_with_user_id in validated_user_ids:
-            try:
-                await note_service.share_note(
-                    db_session=db,
-                    note_id=note_uuid,
-                    shared_by_user_id=user_id,
-                    shared_with_user_id=shared_with_user_id,
-                )
-            except NoteError as e:
-                # Skip if already shared - this is not an error in this context
-                logger.info(
-                    f"Note already shared with user {shared_with_user_id}: {str(e)}"
-                )
-                continue
+        # Share note with all validated users in one statement; users it is
+        # already shared with are skipped by the repository
+        await note_service.share_note_with_users(
+            db_session=db,
+            note_id=note_id,
+            owner_id=user_id,
+            shared_with_user_ids=validated_user_ids,
+        )
 
         # Get all current shares for the note using domain service
         shares = await note_service.get_note_shares(
             db_session=db,
-            note_id=note_uuid,
+            note_id=note_id,
             user_id=user_id,
         )
 
         # Build response with emails
-        shares_response = []
-        for share in shares:
-            shared_email = await get_user_email_by_id(share.shared_with_user_id)
-            shares_response.append(
-                ShareResponse(
-                    id=str(share.id),
-                    note_id=str(share.note_id),
-                    shared_by_user_id=share.shared_by_user_id,
-                    shared_with_user_id=share.shared_with_user_id,
-                    shared_with_email=shared_email or "Email not found",
-                    created_at=share.created_at,
-                )
-            )
-
-        response = NoteSharesResponse(note_id=str(note_id), shares=shares_response)
+        enriched_shares_data = await _add_share_emails(shares)
+        response = NoteSharesResponse.shares_payload(note_id, enriched_shares_data)
         logger.info(
             f"Successfully shared note {note_id} with {len(validated_user_ids)} users"
         )
-        return response
+        return ORJSONResponse(response, status_code=status.HTTP_201_CREATED)
 
     except NoteNotFoundError as e:
         logger.warning(f"Note not found: {str(e)}")
@@ -1187,13 +1117,6 @@ async def share_note(
             "model": NoteSharesResponse,
             "description": "List of all shares for the specified note.",
         },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorResponse,
-            "description": "Invalid note ID format.",
-            "content": {
-                "application/json": {"example": {"detail": "Invalid note ID format."}}
-            },
-        },
         status.HTTP_401_UNAUTHORIZED: {
             "model": ErrorResponse,
             "description": "User authentication required.",
@@ -1229,16 +1152,16 @@ async def share_note(
     },
 )
 async def get_note_shares(
-    note_id: str,
-    request: Request,
+    note_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
     note_service: NoteService = Depends(get_note_service),
     db: Session = Depends(get_db),
 ) -> NoteSharesResponse:
     """Get all shares for a specific note.
 
     Args:
-        note_id (str): UUID of the note to get shares for.
-        request (Request): FastAPI request object containing user headers.
+        note_id (UUID): UUID of the note to get shares for.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         note_service: Note service dependency
         db (Session): Database session dependency injected by FastAPI.
 
@@ -1251,45 +1174,33 @@ async def get_note_shares(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> shares = await get_note_shares("uuid-123", request)
+        >>> shares = await get_note_shares("uuid-123", user_id)
         >>> print(f"Shared with {len(shares.shares)} users")
         Shared with 2 users
     """
     try:
-        user_id = get_current_user_id(request)
-        note_uuid = uuid.UUID(note_id)
-
-        logger.info(f"Getting shares for note {note_uuid} by user {user_id}")
+        logger.info(f"Getting shares for note {note_id} by user {user_id}")
 
         # Use domain service to get shares
-        shares_data = await note_service.get_note_shares(db, note_uuid, user_id)
+        shares_data = await note_service.get_note_shares(db, note_id, user_id)
 
         # Enrich shares with user emails from Keycloak
-        enriched_shares_data = []
-        for share_data in shares_data:
-            shared_email = await get_user_email_by_id(share_data["shared_with_user_id"])
-            enriched_share = {
-                **share_data,
-                "shared_with_email": shared_email or "Email not found",
-            }
-            enriched_shares_data.append(enriched_share)
-
-        # Use classmethod to convert to response
-        response = NoteSharesResponse.from_shares_data(note_id, enriched_shares_data)
+        enriched_shares_data = await _add_share_emails(shares_data)
 
-        logger.info(
-            f"Retrieved {len(enriched_shares_data)} shares for note {note_uuid}"
-        )
-        return response
+        # Build the response payload
+        response = NoteSharesResponse.shares_payload(note_id, enriched_shares_data)
 
-    except ValueError as e:
-        logger.warning(f"Invalid note ID format: {str(e)}")
-        raise HTTPException(status_code=400, detail="Invalid note ID format")
+        logger.info(f"Retrieved {len(enriched_shares_data)} shares for note {note_id}")
+        return ORJSONResponse(response)
 
     except NoteNotFoundError as e:
         logger.warning(f"Note not found: {str(e)}")
         raise HTTPException(status_code=404, detail="Note not found")
 
+    except ValueError as e:
+        logger.warning(f"Invalid request parameters: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
+
     except NoteError as e:
         logger.error(f"Note service error: {str(e)}")
         raise HTTPException(status_code=500, detail="Failed to retrieve note shares")
@@ -1307,13 +1218,6 @@ async def get_note_shares(
         status.HTTP_204_NO_CONTENT: {
             "description": "Share removed successfully.",
         },
-        status.HTTP_400_BAD_REQUEST: {
-            "model": ErrorResponse,
-            "description": "Invalid note ID or share ID format.",
-            "content": {
-                "application/json": {"example": {"detail": "Invalid share ID format."}}
-            },
-        },
         status.HTTP_401_UNAUTHORIZED: {
             "model": ErrorResponse,
             "description": "User authentication required.",
@@ -1349,23 +1253,23 @@ async def get_note_shares(
     },
 )
 async def remove_note_share(
-    note_id: str,
-    share_id: str,
-    request: Request,
+    note_id: UUID,
+    share_id: UUID,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
-):
+) -> Response:
     """Remove a specific share from a note by share ID.
 
     Args:
-        note_id (str): UUID of the note to remove share from.
-        share_id (str): UUID of the specific share to remove.
-        request (Request): FastAPI request object containing user headers.
+        note_id (UUID): UUID of the note to remove share from.
+        share_id (UUID): UUID of the specific share to remove.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
 
     Returns:
-        dict: Success message confirming share removal.
+        Response: Empty 204 No Content response.
 
     Raises:
         HTTPException: 401 if user ID not found in headers.
@@ -1373,32 +1277,24 @@ async def remove_note_share(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> result = await remove_note_share("uuid-123", "share-uuid", request)
-        >>> print(result["message"])
-        "Share removed successfully"
+        >>> result = await remove_note_share("uuid-123", "share-uuid", user_id)
+        >>> print(result.status_code)
+        204
     """
-    user_id = get_current_user_id(request)
     logger.info(f"Removing share {share_id} from note {note_id} for user {user_id}")
 
     try:
-        # Parse UUIDs
-        try:
-            note_uuid = uuid.UUID(note_id)
-            share_uuid = uuid.UUID(share_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid UUID format")
-
         # First get the share details to find the shared_with_user_id
         shares = await note_service.get_note_shares(
             db_session=db,
-            note_id=note_uuid,
+            note_id=note_id,
             user_id=user_id,
         )
 
         # Find the specific share by ID
         target_share = None
         for share in shares:
-            if share.id == share_uuid:
+            if share.id == share_id:
                 target_share = share
                 break
 
@@ -1406,16 +1302,16 @@ async def remove_note_share(
             raise HTTPException(status_code=404, detail="Share not found")
 
         # Use domain service to unshare note
-        success = await note_service.unshare_note(
+        success = await note_service.unshare_note_with_user(
             db_session=db,
-            note_id=note_uuid,
-            shared_by_user_id=user_id,
+            note_id=note_id,
+            owner_id=user_id,
             shared_with_user_id=target_share.shared_with_user_id,
         )
 
         if success:
             logger.info(f"Successfully removed share {share_id}")
-            return {"message": "Share removed successfully"}
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
         else:
             logger.warning(f"Failed to remove share {share_id}")
             raise HTTPException(status_code=500, detail="Failed to remove share")
@@ -1447,7 +1343,7 @@ async def remove_note_share(
         },
         status.HTTP_400_BAD_REQUEST: {
             "model": ErrorResponse,
-            "description": "Invalid note ID format or malformed email address.",
+            "description": "Malformed email address.",
             "content": {
                 "application/json": {"example": {"detail": "Invalid email format."}}
             },
@@ -1489,23 +1385,23 @@ async def remove_note_share(
     },
 )
 async def remove_note_share_by_email(
-    note_id: str,
+    note_id: UUID,
     email: str,
-    request: Request,
+    user_id: UUID = Depends(get_current_user_id),
     db: Session = Depends(get_db),
     note_service: NoteService = Depends(get_note_service),
-):
+) -> Response:
     """Remove a share from a note by email address.
 
     Args:
-        note_id (str): UUID of the note to remove share from.
+        note_id (UUID): UUID of the note to remove share from.
         email (str): Email address of the user to remove from sharing.
-        request (Request): FastAPI request object containing user headers.
+        user_id (UUID): Authenticated user ID resolved from request headers.
         db (Session): Database session dependency injected by FastAPI.
         note_service (NoteService): Domain service for note operations.
 
     Returns:
-        dict: Success message confirming share removal.
+        Response: Empty 204 No Content response.
 
     Raises:
         HTTPException: 400 if user not found for email.
@@ -1514,22 +1410,15 @@ async def remove_note_share_by_email(
         HTTPException: 500 if internal server errors occur.
 
     Example:
-        >>> result = await remove_note_share_by_email("uuid-123", "user@email.com", request)
-        >>> print(result["message"])
-        "Share removed successfully"
+        >>> result = await remove_note_share_by_email("uuid-123", "user@email.com", user_id)
+        >>> print(result.status_code)
+        204
     """
-    user_id = get_current_user_id(request)
     logger.info(
         f"Removing share from note {note_id} for email {email} by user {user_id}"
     )
 
     try:
-        # Parse note UUID
-        try:
-            note_uuid = uuid.UUID(note_id)
-        except ValueError:
-            raise HTTPException(status_code=400, detail="Invalid note ID format")
-
         # Get user ID from email
         shared_with_user_id = await get_user_id_by_email(email)
         if not shared_with_user_id:
@@ -1538,10 +1427,10 @@ async def remove_note_share_by_email(
             )
 
         # Use domain service to unshare note
-        success = await note_service.unshare_note(
+        success = await note_service.unshare_note_with_user(
             db_session=db,
-            note_id=note_uuid,
-            shared_by_user_id=user_id,
+            note_id=note_id,
+            owner_id=user_id,
             shared_with_user_id=shared_with_user_id,
         )
 
@@ -1549,7 +1438,7 @@ async def remove_note_share_by_email(
             logger.info(
                 f"Successfully removed share from note {note_id} for email {email}"
             )
-            return {"message": "Share removed successfully"}
+            return Response(status_code=status.HTTP_204_NO_CONTENT)
         else:
             logger.warning(
                 f"Failed to remove share from note {note_id} for email {email}"
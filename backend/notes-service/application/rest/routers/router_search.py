@@ -5,19 +5,21 @@ This module contains the FastAPI router for search operations.
 
 import logging
 from typing import Annotated, Union
+from uuid import UUID
 
+from application.rest.responses import ORJSONResponse
 from application.rest.schemas.input.search_input import SearchNotesRequest
 from application.rest.schemas.output.common_output import ErrorResponse
 from application.rest.schemas.output.search_output import SearchResultResponse
-from domain.entities.search import SearchCriteria
+from domain.entities.search import SearchCriteria, SearchSection
 from domain.services.search_service import SearchError, SearchService
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 from utils.dependencies import get_current_user_id, get_db, get_search_service
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
 
 
 @router.get(
@@ -34,9 +36,7 @@ router = APIRouter()
             "model": ErrorResponse,
             "description": "Invalid request parameters.",
             "content": {
-                "application/json": {
-                    "example": {"detail": "Invalid section parameter."}
-                }
+                "application/json": {"example": {"detail": "Invalid search cursor."}}
             },
         },
         status.HTTP_401_UNAUTHORIZED: {
@@ -56,31 +56,39 @@ router = APIRouter()
     },
 )
 async def search_notes(
-    request: Request,
-    q: Annotated[str, Query(description="Search query string")] = "",
+    user_id: UUID = Depends(get_current_user_id),
+    q: Annotated[
+        str,
+        Query(description='Search query; supports "phrases", OR and -exclusions'),
+    ] = "",
     tags: Annotated[
         Union[str, None], Query(description="Comma-separated tag UUIDs")
     ] = None,
     section: Annotated[
-        str,
+        SearchSection,
         Query(description="Section to search: my-notes, shared-by-me, shared-with-me"),
-    ] = "my-notes",
+    ] = SearchSection.MY_NOTES,
     page: Annotated[int, Query(ge=1, description="Page number (1-based)")] = 1,
     limit: Annotated[
         int, Query(ge=1, le=100, description="Number of results per page")
     ] = 15,
+    after: Annotated[
+        Union[str, None],
+        Query(description="Keyset cursor (pagination.next_cursor of last page)"),
+    ] = None,
     search_service: SearchService = Depends(get_search_service),
     db: Session = Depends(get_db),
 ) -> SearchResultResponse:
     """Search notes with optional text query and tag filters.
 
     Args:
-        request: FastAPI request object
+        user_id: Authenticated user ID resolved from request headers
         q: Search query string
         tags: Comma-separated tag UUIDs for filtering
         section: Section to search in
         page: Page number for pagination
         limit: Number of results per page
+        after: Keyset cursor; when given, page offset is ignored
         search_service: Search service dependency
         db: Database session dependency
 
@@ -89,21 +97,23 @@ async def search_notes(
 
     Raises:
         HTTPException: 400 for invalid parameters, 401 for auth errors, 500 for server errors
+
+    Note:
+        Unknown sections are rejected by FastAPI with 422 before the handler runs.
     """
     try:
-        user_id = get_current_user_id(request)
-
-        search_request = SearchNotesRequest(
-            q=q, tags=tags, section=section, page=page, limit=limit
-        )
-
-        if not search_request.has_search_criteria():
+        # Reject requests without criteria before any parsing or DB work
+        q = q.strip()
+        if not q and not (tags and tags.strip()):
             raise HTTPException(
                 status_code=400, detail="Search query or tags must be provided"
             )
 
+        search_request = SearchNotesRequest(
+            q=q, tags=tags, section=section, page=page, limit=limit, after=after
+        )
+
         search_criteria = SearchCriteria.from_search_request(search_request, user_id)
-        search_service.validate_search_criteria(search_criteria)
 
         search_result = await search_service.search_notes(db, search_criteria)
         response = SearchResultResponse.from_entity(search_result)
@@ -113,7 +123,10 @@ async def search_notes(
             f"out of {search_result.pagination.total_notes} total for user {user_id}"
         )
 
-        return response
+        return ORJSONResponse(response)
+
+    except HTTPException:
+        raise
 
     except ValueError as e:
         logger.warning(f"Invalid search request: {str(e)}")
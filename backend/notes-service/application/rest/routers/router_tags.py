@@ -2,18 +2,30 @@
 This module contains the FastAPI router for tags operations.
 """
 
-from typing import List
+import hashlib
+from typing import Dict, List, Tuple
 
+from application.rest.responses import ORJSONResponse
 from application.rest.schemas.output.common_output import ErrorResponse
 from application.rest.schemas.output.tag_output import TagResponse
+from domain.entities.tag import TagEntity
 from domain.services.tag_service import (
     TagService,
 )
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
+from utils.config import TAGS_CACHE_TTL_SECONDS
 from utils.dependencies import get_db, get_tag_service
 
-router = APIRouter()
+router = APIRouter(default_response_class=ORJSONResponse)
+
+# Encoded body and ETag of the last tag list served, keyed on its tags. The
+# list itself is cached by the tag repository; this only skips re-encoding it.
+_encoded_tags: Dict[Tuple[TagEntity, ...], Tuple[bytes, str]] = {}
+
+# Serializer for the whole list, built once instead of per request
+_TAG_LIST_ADAPTER = TypeAdapter(List[TagResponse])
 
 
 @router.get(
@@ -26,6 +38,9 @@ router = APIRouter()
             "model": List[TagResponse],
             "description": "List of all available tags.",
         },
+        status.HTTP_304_NOT_MODIFIED: {
+            "description": "Tags unchanged since the ETag sent in If-None-Match.",
+        },
         status.HTTP_500_INTERNAL_SERVER_ERROR: {
             "model": ErrorResponse,
             "description": "Internal server error - database connection failed.",
@@ -38,8 +53,10 @@ router = APIRouter()
     },
 )
 async def get_tags(
-    db: Session = Depends(get_db), tag_service: TagService = Depends(get_tag_service)
-) -> List[TagResponse]:
+    request: Request,
+    db: Session = Depends(get_db),
+    tag_service: TagService = Depends(get_tag_service),
+) -> Response:
     """Get all available tags using clean DDD architecture.
 
     This endpoint demonstrates clean DDD architecture:
@@ -49,12 +66,17 @@ async def get_tags(
     4. Repository handles data persistence using SQLAlchemy with session
     5. Results flow back through layers with conversions (Entity -> Pydantic)
 
+    The encoded list is reused while the tag list is unchanged and served
+    with an ETag, so clients revalidating with If-None-Match get 304.
+
     Args:
+        request (Request): FastAPI request object, read for If-None-Match.
         db (Session): Fresh database session for this request.
         tag_service (TagService): Domain service with injected repository.
 
     Returns:
-        List[TagResponse]: List of all tag response schemas.
+        Response: JSON list of all tags, or an empty 304 response when the
+        client's ETag is current.
 
     Raises:
         HTTPException: 500 if internal server errors occur.
@@ -65,8 +87,28 @@ async def get_tags(
         ['personal', 'work']
     """
     try:
-        tag_entities = await tag_service.get_all_tags(db)
-        return [TagResponse.from_entity(tag) for tag in tag_entities]
+        tag_entities = tuple(await tag_service.get_all_tags(db))
+        cached = _encoded_tags.get(tag_entities)
+        if cached is None:
+            tag_responses = [TagResponse.from_entity(tag) for tag in tag_entities]
+            payload = _TAG_LIST_ADAPTER.dump_json(tag_responses)
+            etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+            # Only the current tag list is worth keeping
+            _encoded_tags.clear()
+            cached = _encoded_tags[tag_entities] = (payload, etag)
+
+        payload, etag = cached
+        headers = {
+            "ETag": etag,
+            "Cache-Control": f"private, max-age={TAGS_CACHE_TTL_SECONDS}",
+        }
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # The cached body is already JSON, so it is sent without re-encoding
+        return Response(
+            content=payload, media_type=ORJSONResponse.media_type, headers=headers
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
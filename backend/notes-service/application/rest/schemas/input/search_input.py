@@ -6,7 +6,11 @@ This module contains Pydantic models for search request input validation.
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field, validator
+from domain.entities.search import SearchSection
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, validator
+
+# Built once so each parse goes straight to pydantic-core
+_UUID_LIST = TypeAdapter(List[UUID])
 
 
 class SearchNotesRequest(BaseModel):
@@ -21,6 +25,7 @@ class SearchNotesRequest(BaseModel):
         section: Section to search in (my-notes, shared-by-me, shared-with-me)
         page: Page number for pagination (1-based)
         limit: Number of results per page
+        after: Keyset cursor from a previous pagination.next_cursor (optional)
     """
 
     q: Optional[str] = Field(
@@ -31,7 +36,9 @@ class SearchNotesRequest(BaseModel):
         default=None, description="Comma-separated tag UUIDs for filtering"
     )
 
-    section: str = Field(default="my-notes", description="Section to search in")
+    section: SearchSection = Field(
+        default=SearchSection.MY_NOTES, description="Section to search in"
+    )
 
     page: int = Field(
         default=1, ge=1, description="Page number for pagination (1-based)"
@@ -41,13 +48,9 @@ class SearchNotesRequest(BaseModel):
         default=15, ge=1, le=100, description="Number of results per page"
     )
 
-    @validator("section")
-    def validate_section(cls, v):
-        """Validate the section parameter."""
-        allowed_sections = {"my-notes", "shared-by-me", "shared-with-me"}
-        if v not in allowed_sections:
-            raise ValueError(f'Section must be one of: {", ".join(allowed_sections)}')
-        return v
+    after: Optional[str] = Field(
+        default=None, description="Keyset cursor returned by a previous search"
+    )
 
     @validator("q")
     def validate_query(cls, v):
@@ -68,14 +71,14 @@ class SearchNotesRequest(BaseModel):
         if not self.tags:
             return None
 
+        stripped_ids = (tag_id.strip() for tag_id in self.tags.split(","))
+        raw_ids = [tag_id for tag_id in stripped_ids if tag_id]
         try:
-            return [
-                UUID(tag_id.strip())
-                for tag_id in self.tags.split(",")
-                if tag_id.strip()
-            ]
-        except ValueError as e:
-            raise ValueError(f"Invalid UUID format for tag IDs: {str(e)}")
+            return _UUID_LIST.validate_python(raw_ids)
+        except ValidationError:
+            raise ValueError(
+                "Invalid UUID format for tag IDs: badly formed hexadecimal UUID string"
+            )
 
     def has_search_criteria(self) -> bool:
         """Check if the request has any search criteria.
@@ -83,4 +86,5 @@ class SearchNotesRequest(BaseModel):
         Returns:
             True if either query or tags are provided, False otherwise
         """
-        return bool(self.q and self.q.strip()) or bool(self.tags)
+        # q is already stripped by validate_query
+        return bool(self.q) or bool(self.tags)
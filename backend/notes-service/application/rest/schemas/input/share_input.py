@@ -3,22 +3,32 @@
 This module contains Pydantic models for note sharing-related API requests.
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, validator
 from typing import List
+from uuid import UUID
 
 
 class ShareRequest(BaseModel):
     """Schema for sharing a note with other users.
     
     Attributes:
-        note_id (str): UUID string of the note to be shared.
+        note_id (UUID): UUID of the note to be shared.
         emails (List[str]): List of email addresses to share the note with.
+            Addresses are trimmed, lowercased and deduplicated (order preserved).
         
     Example:
         >>> share_data = ShareRequest(
         ...     note_id="note-uuid-123",
-        ...     emails=["user1@example.com", "user2@example.com"]
+        ...     emails=["user1@example.com", "User1@Example.com "]
         ... )
+        >>> share_data.emails
+        ['user1@example.com']
     """
-    note_id: str  # UUID string
+    note_id: UUID
     emails: List[str]  # List of email addresses to share with
+
+    @validator("emails")
+    def normalize_emails(cls, v):
+        """Normalize and deduplicate email addresses."""
+        normalized = (email.strip().lower() for email in v)
+        return list(dict.fromkeys(email for email in normalized if email))
@@ -4,8 +4,8 @@ This module contains shared Pydantic models for common API responses
 like error messages and status information.
 """
 
-from pydantic import BaseModel
-from typing import Optional, Any
+from pydantic import BaseModel, ConfigDict
+from typing import Optional
 
 
 class ErrorResponse(BaseModel):
@@ -21,27 +21,12 @@ class ErrorResponse(BaseModel):
         ...     error_code="NOT_FOUND"
         ... )
     """
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     detail: str
     error_code: Optional[str] = None
 
 
-class MessageResponse(BaseModel):
-    """Schema for simple message responses.
-    
-    Attributes:
-        message (str): Success or informational message.
-        data (Any, optional): Additional response data.
-        
-    Example:
-        >>> message_response = MessageResponse(
-        ...     message="Operation completed successfully",
-        ...     data={"id": "123"}
-        ... )
-    """
-    message: str
-    data: Optional[Any] = None
-
-
 class HealthResponse(BaseModel):
     """Schema for health check responses.
     
@@ -55,5 +40,7 @@ class HealthResponse(BaseModel):
         ...     service="notes-service"
         ... )
     """
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     status: str
     service: str
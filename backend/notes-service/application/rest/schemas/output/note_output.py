@@ -1,33 +1,37 @@
 """Note output schemas for API responses.
 
 This module contains Pydantic models for note-related API responses,
-including single notes, pagination info, and note lists.
+including single notes, pagination info, and note lists. Paginated lists are
+sent as slotted ``NoteRow`` dataclasses, which orjson encodes without building
+a model or dict per row; the Pydantic models document their shape.
 """
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+from uuid import UUID
 
-from application.rest.schemas.output.tag_output import TagResponse
-from pydantic import BaseModel
+from application.rest.schemas.output.tag_output import TagResponse, TagRow
+from pydantic import BaseModel, ConfigDict
 
 if TYPE_CHECKING:
     from domain.entities.note import Note
-    from domain.entities.search import PaginationMetadata, SearchResult
+    from domain.entities.search import PaginationMetadata
 
 
 class NoteResponse(BaseModel):
     """Schema for note data in API responses.
 
     Attributes:
-        id (str): UUID string identifier of the note.
+        id (UUID): UUID identifier of the note.
         title (str): The title of the note.
         content (str): The content/body of the note.
-        owner_id (str): Keycloak UUID of the note owner.
+        owner_id (UUID): Keycloak UUID of the note owner.
         created_at (datetime): Timestamp when the note was created.
         updated_at (datetime): Timestamp when the note was last updated.
-        tags (List[dict]): List of tags associated with the note.
+        tags (List[TagResponse]): List of tags associated with the note.
 
     Example:
         >>> note_response = NoteResponse(
@@ -41,10 +45,12 @@ class NoteResponse(BaseModel):
         ... )
     """
 
-    id: str  # UUID as string
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+    id: UUID
     title: str
     content: str
-    owner_id: str  # Keycloak UUID
+    owner_id: UUID  # Keycloak UUID
     created_at: datetime
     updated_at: datetime
     tags: List[TagResponse]
@@ -53,6 +59,9 @@ class NoteResponse(BaseModel):
     def from_entity(cls, note: Note) -> NoteResponse:
         """Create NoteResponse from Note domain entity.
 
+        Fields (including nested tags) are read from the entity's attributes
+        by pydantic-core, without copying them in Python first.
+
         Args:
             note: The domain Note entity to convert
 
@@ -60,14 +69,52 @@ class NoteResponse(BaseModel):
             NoteResponse: The converted note response schema
         """
 
+        return cls.model_validate(note)
+
+
+@dataclass(frozen=True, slots=True)
+class NoteRow:
+    """Lightweight note row serialized natively by orjson.
+
+    Mirrors NoteResponse field for field for list payloads, where a Pydantic
+    model per row costs an instance dict and a model_dump at render time.
+
+    Attributes:
+        id (UUID): UUID identifier of the note.
+        title (str): The title of the note.
+        content (str): The content/body of the note.
+        owner_id (UUID): Keycloak UUID of the note owner.
+        created_at (datetime): Timestamp when the note was created.
+        updated_at (datetime): Timestamp when the note was last updated.
+        tags (Tuple[TagRow, ...]): Tags associated with the note.
+    """
+
+    id: UUID
+    title: str
+    content: str
+    owner_id: UUID
+    created_at: datetime
+    updated_at: datetime
+    tags: Tuple[TagRow, ...]
+
+    @classmethod
+    def from_entity(cls, note: Note) -> NoteRow:
+        """Create a NoteRow from a Note domain entity.
+
+        Args:
+            note: The domain Note entity to convert
+
+        Returns:
+            NoteRow: The converted note row
+        """
         return cls(
-            id=str(note.id),
+            id=note.id,
             title=note.title,
             content=note.content,
-            owner_id=str(note.owner_id),
+            owner_id=note.owner_id,
             created_at=note.created_at,
             updated_at=note.updated_at,
-            tags=[TagResponse.from_entity(tag) for tag in note.tags],
+            tags=tuple(map(TagRow.from_entity, note.tags)),
         )
 
 
@@ -75,12 +122,14 @@ class PaginationInfo(BaseModel):
     """Schema for pagination metadata in API responses.
 
     Attributes:
-        current_page (int): Current page number (1-indexed).
+        current_page (Optional[int]): Current page number (1-indexed); None for
+            pages reached with a keyset cursor.
         total_pages (int): Total number of pages available.
         total_notes (int): Total number of notes across all pages.
         notes_per_page (int): Number of notes per page.
         has_next (bool): Whether there is a next page available.
         has_previous (bool): Whether there is a previous page available.
+        next_cursor (Optional[str]): Keyset cursor for the next page, if any.
 
     Example:
         >>> pagination = PaginationInfo(
@@ -93,30 +142,41 @@ class PaginationInfo(BaseModel):
         ... )
     """
 
-    current_page: int
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+    current_page: Optional[int]
     total_pages: int
     total_notes: int
     notes_per_page: int
     has_next: bool
     has_previous: bool
+    next_cursor: Optional[str] = None
 
     @classmethod
-    def from_entity(cls, pagination_metadata: PaginationMetadata) -> PaginationInfo:
+    def from_entity(
+        cls,
+        pagination_metadata: PaginationMetadata,
+        next_cursor: Optional[str] = None,
+    ) -> PaginationInfo:
         """Convert domain PaginationMetadata to API response PaginationInfo.
 
         Args:
             pagination_metadata: Domain pagination metadata entity.
+            next_cursor: Encoded keyset cursor for the next page (optional).
 
         Returns:
             PaginationInfo: Corresponding API response model.
         """
-        return cls(
+        # Built on every paginated response: plain field copy, no validation
+        # and no assignment through the model's __setattr__
+        return cls.model_construct(
             current_page=pagination_metadata.current_page,
             total_pages=pagination_metadata.total_pages,
             total_notes=pagination_metadata.total_notes,
             notes_per_page=pagination_metadata.notes_per_page,
             has_next=pagination_metadata.has_next,
             has_previous=pagination_metadata.has_previous,
+            next_cursor=next_cursor,
         )
 
 
@@ -134,20 +194,24 @@ class NotesListResponse(BaseModel):
         ... )
     """
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
     notes: List[NoteResponse]
     pagination: PaginationInfo
 
-    @classmethod
-    def from_entity(cls, search_result: SearchResult) -> NotesListResponse:
-        """Convert domain SearchResult to API response NotesListResponse.
+    @staticmethod
+    def page_parts(
+        notes: List[Note], pagination: PaginationMetadata
+    ) -> Tuple[Iterator[NoteRow], PaginationInfo]:
+        """Split a page of domain notes into streamable response parts.
 
         Args:
-            search_result: Domain search result entity.
+            notes: Domain notes of the current page.
+            pagination: Domain pagination metadata for the page.
 
         Returns:
-            NotesListResponse: Corresponding API response model.
+            Tuple[Iterator[NoteRow], PaginationInfo]: Lazily converted rows
+                and the pagination metadata, in NotesListResponse shape.
         """
-        return cls(
-            notes=[NoteResponse.from_entity(note) for note in search_result.notes],
-            pagination=PaginationInfo.from_entity(search_result.pagination),
-        )
+        # Rows are converted while the body streams, one at a time
+        return map(NoteRow.from_entity, notes), PaginationInfo.from_entity(pagination)
@@ -3,11 +3,16 @@
 This module contains Pydantic models for search response output serialization.
 """
 
+from __future__ import annotations
+
 from datetime import datetime
-from typing import List
+from typing import TYPE_CHECKING, List
 
 from application.rest.schemas.output.note_output import NoteResponse, PaginationInfo
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, computed_field
+
+if TYPE_CHECKING:
+    from domain.entities.search import SearchResult
 
 
 class SearchResultResponse(BaseModel):
@@ -22,18 +27,25 @@ class SearchResultResponse(BaseModel):
         search_timestamp: When the search was performed
         search_query: The original search query used
         search_section: The section that was searched
-        total_results: Total number of results found (convenience field)
+        total_results: Total number of results found (computed from pagination)
     """
 
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
     notes: List[NoteResponse]
     pagination: PaginationInfo
     search_timestamp: datetime
     search_query: str
     search_section: str
-    total_results: int
+
+    @computed_field
+    @property
+    def total_results(self) -> int:
+        """Total number of results found (convenience field)."""
+        return self.pagination.total_notes
 
     @classmethod
-    def from_entity(cls, search_result) -> "SearchResultResponse":
+    def from_entity(cls, search_result: SearchResult) -> SearchResultResponse:
         """Convert domain SearchResult to API response SearchResultResponse.
 
         Args:
@@ -43,11 +55,19 @@ class SearchResultResponse(BaseModel):
             SearchResultResponse: Complete search response with metadata.
         """
 
-        return cls(
-            notes=[NoteResponse.from_entity(note) for note in search_result.notes],
-            pagination=PaginationInfo.from_entity(search_result.pagination),
-            search_timestamp=search_result.search_timestamp,
-            search_query=search_result.criteria.query or "",
-            search_section=search_result.criteria.section.value,
-            total_results=search_result.pagination.total_notes,
+        next_cursor = (
+            search_result.next_cursor.encode() if search_result.next_cursor else None
+        )
+
+        # Notes are read from the domain entities by pydantic-core in one call
+        return cls.model_validate(
+            {
+                "notes": search_result.notes,
+                "pagination": PaginationInfo.from_entity(
+                    search_result.pagination, next_cursor=next_cursor
+                ),
+                "search_timestamp": search_result.search_timestamp,
+                "search_query": search_result.criteria.query or "",
+                "search_section": search_result.criteria.section.value,
+            }
         )
@@ -5,18 +5,19 @@ This module contains Pydantic models for share-related API responses.
 
 from datetime import datetime
 from typing import List
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class ShareResponse(BaseModel):
     """Schema for share data in API responses.
 
     Attributes:
-        id (str): UUID string identifier of the share.
-        note_id (str): UUID string of the shared note.
-        shared_by_user_id (str): Keycloak UUID of the user who shared the note.
-        shared_with_user_id (str): Keycloak UUID of the user who received the share.
+        id (UUID): Unique identifier of the share.
+        note_id (UUID): UUID of the shared note.
+        shared_by_user_id (UUID): Keycloak UUID of the user who shared the note.
+        shared_with_user_id (UUID): Keycloak UUID of the user who received the share.
         shared_with_email (str): Email address of the user who received the share.
         created_at (datetime): Timestamp when the share was created.
 
@@ -31,38 +32,21 @@ class ShareResponse(BaseModel):
         ... )
     """
 
-    id: str  # UUID string
-    note_id: str  # UUID string
-    shared_by_user_id: str
-    shared_with_user_id: str
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    id: UUID
+    note_id: UUID
+    shared_by_user_id: UUID
+    shared_with_user_id: UUID
     shared_with_email: str
     created_at: datetime
 
-    @classmethod
-    def from_share_data(cls, share_data: dict) -> "ShareResponse":
-        """Create ShareResponse from repository share data.
-
-        Args:
-            share_data: Dictionary from repository with share information
-
-        Returns:
-            ShareResponse: The converted share response schema
-        """
-        return cls(
-            id=str(share_data["id"]),
-            note_id=str(share_data["note_id"]),
-            shared_by_user_id=str(share_data["shared_by_user_id"]),
-            shared_with_user_id=str(share_data["shared_with_user_id"]),
-            shared_with_email=share_data.get("shared_with_email", ""),
-            created_at=share_data["created_at"],
-        )
-
 
 class NoteSharesResponse(BaseModel):
     """Schema for note shares list API responses.
 
     Attributes:
-        note_id (str): UUID string of the note.
+        note_id (UUID): UUID of the note.
         shares (List[ShareResponse]): List of shares for the note.
 
     Example:
@@ -72,23 +56,26 @@ class NoteSharesResponse(BaseModel):
         ... )
     """
 
-    note_id: str  # UUID string
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
+    note_id: UUID
     shares: List[ShareResponse]
 
-    @classmethod
-    def from_shares_data(
-        cls, note_id: str, shares_data: List[dict]
-    ) -> "NoteSharesResponse":
-        """Create NoteSharesResponse from repository shares data.
+    @staticmethod
+    def shares_payload(note_id: UUID, shares_data: List[dict]) -> dict:
+        """Build the note shares JSON payload from enriched share data.
+
+        The share dictionaries from the repository, once enriched with
+        "shared_with_email", already have the ShareResponse shape and only
+        hold values orjson encodes natively, so they are passed through as-is
+        instead of being rebuilt as one model per share. This schema remains
+        the route's response_model for the OpenAPI documentation.
 
         Args:
-            note_id: UUID string of the note
-            shares_data: List of share dictionaries from repository
+            note_id: UUID of the note
+            shares_data: List of enriched share dictionaries
 
         Returns:
-            NoteSharesResponse: The converted note shares response schema
+            dict: Payload to render with ORJSONResponse
         """
-        return cls(
-            note_id=note_id,
-            shares=[ShareResponse.from_share_data(share) for share in shares_data],
-        )
+        return {"note_id": note_id, "shares": shares_data}
@@ -1,26 +1,36 @@
 """Tag output schemas for API responses.
 
-This module contains Pydantic models for tag-related API responses.
+This module contains Pydantic models for tag-related API responses, plus a
+slotted row type used when tags are nested in hot list payloads.
 """
 
 from __future__ import annotations
 
-from domain.entities.tag import TagEntity
-from pydantic import BaseModel
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+if TYPE_CHECKING:
+    from domain.entities.tag import TagEntity
 
 
 class TagResponse(BaseModel):
     """Schema for tag data in API responses.
 
     Attributes:
-        id (str): UUID string identifier of the tag.
+        id (UUID): UUID identifier of the tag.
         name (str): The name of the tag.
 
     Example:
         >>> tag_response = TagResponse(id="tag-uuid-123", name="work")
     """
 
-    id: str  # UUID as string
+    model_config = ConfigDict(from_attributes=True, frozen=True, defer_build=True)
+
+    id: UUID
     name: str
 
     @classmethod
@@ -35,4 +45,41 @@ class TagResponse(BaseModel):
         """
         if tag_entity.is_new():
             raise ValueError("Cannot convert new tag entity to response (no ID)")
-        return cls(id=str(tag_entity.id), name=tag_entity.name)
+        return cls.model_validate(tag_entity)
+
+
+@dataclass(frozen=True, slots=True)
+class TagRow:
+    """Lightweight tag row serialized natively by orjson.
+
+    Mirrors TagResponse field for field; TagResponse remains the documented
+    schema.
+
+    Attributes:
+        id (UUID): UUID identifier of the tag.
+        name (str): The name of the tag.
+    """
+
+    id: UUID
+    name: str
+
+    @classmethod
+    def from_entity(cls, tag_entity: TagEntity) -> TagRow:
+        """Get the TagRow for a TagEntity.
+
+        Rows are immutable, so one instance per (id, name) is shared across
+        every note of every page that carries the tag.
+
+        Args:
+            tag_entity (TagEntity): The domain entity to convert.
+
+        Returns:
+            TagRow: The shared tag row.
+        """
+        return _cached_tag_row(tag_entity.id, tag_entity.name)
+
+
+@lru_cache(maxsize=4096)
+def _cached_tag_row(tag_id: UUID, name: str) -> TagRow:
+    """Build the TagRow for a tag, memoized by (id, name)."""
+    return TagRow(id=tag_id, name=name)
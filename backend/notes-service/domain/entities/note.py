@@ -4,16 +4,47 @@ This module contains the core Note domain entity representing
 a note in the system following Domain-Driven Design principles.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional
-from uuid import UUID
+from typing import TYPE_CHECKING, FrozenSet, List, Optional
+from uuid import UUID, uuid4
 
 if TYPE_CHECKING:
     from domain.entities.tag import TagEntity
 
 
-@dataclass
+def _trigrams(text: str) -> FrozenSet[str]:
+    """Return the set of three-character substrings of a text.
+
+    Args:
+        text (str): Text to split into trigrams.
+
+    Returns:
+        FrozenSet[str]: Distinct trigrams of the text.
+    """
+    return frozenset(text[i : i + 3] for i in range(len(text) - 2))
+
+
+def _require_text(value: str, message: str) -> str:
+    """Strip a required text value, rejecting blank input.
+
+    Args:
+        value (str): Text to validate.
+        message (str): Error message used when the text is blank.
+
+    Returns:
+        str: The stripped text, the same object when nothing was stripped.
+
+    Raises:
+        ValueError: If the text is empty or only whitespace.
+    """
+    stripped = value.strip()
+    if not stripped:
+        raise ValueError(message)
+    return stripped
+
+
+@dataclass(slots=True)
 class Note:
     """Domain entity representing a note in the shared notes system.
 
@@ -29,7 +60,6 @@ class Note:
         created_at (datetime): Timestamp when the note was created.
         updated_at (datetime): Timestamp when the note was last updated.
         is_deleted (bool): Whether the note is soft deleted.
-        search_vector (Optional[str]): Full-text search vector (handled by infrastructure).
     """
 
     id: UUID
@@ -40,18 +70,24 @@ class Note:
     created_at: datetime
     updated_at: datetime
     is_deleted: bool = False
-    search_vector: Optional[str] = None  # Handled by infrastructure layer
+    # Lazily built set of tag IDs, reset whenever the tags change
+    _tag_ids: Optional[FrozenSet[UUID]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Lazily built trigrams of the lowercased title and content, reset
+    # whenever they change
+    _trigrams: Optional[FrozenSet[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        """Validate note after initialization.
+        """Validate and normalize note after initialization.
 
         Raises:
             ValueError: If note title or content are empty.
         """
-        if not self.title.strip():
-            raise ValueError("Note title cannot be empty")
-        if not self.content.strip():
-            raise ValueError("Note content cannot be empty")
+        self.title = _require_text(self.title, "Note title cannot be empty")
+        self.content = _require_text(self.content, "Note content cannot be empty")
 
     @classmethod
     def create_new(
@@ -75,13 +111,11 @@ class Note:
         Raises:
             ValueError: If title or content are empty.
         """
-        from uuid import uuid4
-
         now = datetime.utcnow()
         return cls(
             id=uuid4(),
-            title=title.strip(),
-            content=content.strip(),
+            title=title,
+            content=content,
             owner_id=owner_id,
             tags=tags or [],
             created_at=now,
@@ -121,13 +155,12 @@ class Note:
         Raises:
             ValueError: If title or content are empty.
         """
-        if not title.strip():
-            raise ValueError("Note title cannot be empty")
-        if not content.strip():
-            raise ValueError("Note content cannot be empty")
+        title = _require_text(title, "Note title cannot be empty")
+        content = _require_text(content, "Note content cannot be empty")
 
-        self.title = title.strip()
-        self.content = content.strip()
+        self.title = title
+        self.content = content
+        self._trigrams = None
         self.updated_at = datetime.utcnow()
 
     def add_tag(self, tag: "TagEntity") -> None:
@@ -136,8 +169,9 @@ class Note:
         Args:
             tag (TagEntity): The tag to add to the note.
         """
-        if tag not in self.tags:
+        if not self._contains_tag(tag):
             self.tags.append(tag)
+            self._tag_ids = None
             self.updated_at = datetime.utcnow()
 
     def remove_tag(self, tag: "TagEntity") -> None:
@@ -146,9 +180,41 @@ class Note:
         Args:
             tag (TagEntity): The tag to remove from the note.
         """
-        if tag in self.tags:
+        if not self._contains_tag(tag):
+            return
+
+        if tag.is_new():
             self.tags.remove(tag)
-            self.updated_at = datetime.utcnow()
+        else:
+            # Single scan for the position; list order is kept for display
+            del self.tags[[t.id for t in self.tags].index(tag.id)]
+        self._tag_ids = None
+        self.updated_at = datetime.utcnow()
+
+    def _contains_tag(self, tag: "TagEntity") -> bool:
+        """Check if a tag entity is associated with the note.
+
+        Persisted tags are looked up by ID in the cached tag ID set. New tags
+        have no ID yet and are compared by value.
+
+        Args:
+            tag (TagEntity): The tag to look for.
+
+        Returns:
+            bool: True if the tag is associated with the note, False otherwise.
+        """
+        if tag.is_new():
+            return tag in self.tags
+        return tag.id in self._get_tag_ids()
+
+    def replace_tags(self, tags: List["TagEntity"]) -> None:
+        """Replace all tags of the note.
+
+        Args:
+            tags (List[TagEntity]): The new tags of the note.
+        """
+        self.tags = tags
+        self._tag_ids = None
 
     def soft_delete(self) -> None:
         """Soft delete the note."""
@@ -180,7 +246,7 @@ class Note:
         Returns:
             bool: True if the note has the tag, False otherwise.
         """
-        return any(tag.id == tag_id for tag in self.tags)
+        return tag_id in self._get_tag_ids()
 
     def has_all_tags(self, tag_ids: List[UUID]) -> bool:
         """Check if the note has all the specified tags.
@@ -191,9 +257,18 @@ class Note:
         Returns:
             bool: True if the note has all specified tags, False otherwise.
         """
-        note_tag_ids = {tag.id for tag in self.tags}
-        required_tag_ids = set(tag_ids)
-        return required_tag_ids.issubset(note_tag_ids)
+        # issuperset accepts any iterable, so tag_ids is not copied into a set
+        return self._get_tag_ids().issuperset(tag_ids)
+
+    def _get_tag_ids(self) -> FrozenSet[UUID]:
+        """Return the IDs of the note's tags, building the set on first use.
+
+        Returns:
+            FrozenSet[UUID]: IDs of the tags associated with the note.
+        """
+        if self._tag_ids is None:
+            self._tag_ids = frozenset(tag.id for tag in self.tags)
+        return self._tag_ids
 
     def matches_text_search(self, query: str) -> bool:
         """Check if the note matches a text search query.
@@ -208,8 +283,29 @@ class Note:
         Returns:
             bool: True if the note matches the query, False otherwise.
         """
-        if not query.strip():
+        needle = query.strip().lower()
+        if not needle:
             return True
 
-        query_lower = query.lower().strip()
-        return query_lower in self.title.lower() or query_lower in self.content.lower()
+        # lower() keeps the length of ASCII text (isascii() is O(1)), so a
+        # needle longer than such a field cannot occur in it
+        title_fits = len(needle) <= len(self.title) or not self.title.isascii()
+        content_fits = len(needle) <= len(self.content) or not self.content.isascii()
+        if not (title_fits or content_fits):
+            return False
+
+        # Every trigram of a match is a trigram of the note, so a missing one
+        # rules the note out without scanning the title or content
+        if len(needle) >= 3:
+            if self._trigrams is None:
+                self._trigrams = _trigrams(
+                    f"{self.title.lower()}\x01{self.content.lower()}"
+                )
+            if not self._trigrams.issuperset(_trigrams(needle)):
+                return False
+
+        # The title is short and checked first; content is only lowercased
+        # when the title does not match
+        return (title_fits and needle in self.title.lower()) or (
+            content_fits and needle in self.content.lower()
+        )
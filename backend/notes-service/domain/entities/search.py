@@ -4,25 +4,76 @@ This module contains the domain entities for search functionality, representing
 the core business concepts related to searching notes.
 """
 
+import base64
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID
 
 if TYPE_CHECKING:
     from domain.entities.note import Note
 
+# Business rule: upper bound on the number of tags a search may filter by
+MAX_TAG_FILTERS = 10
 
-class SearchSection(Enum):
-    """Enumeration for different search sections."""
+
+class SearchSection(str, Enum):
+    """Enumeration for different search sections.
+
+    Values double as the accepted ``section`` query parameter, so the API layer
+    validates sections at parse time.
+    """
 
     MY_NOTES = "my-notes"
     SHARED_BY_ME = "shared-by-me"
     SHARED_WITH_ME = "shared-with-me"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class SearchCursor:
+    """Keyset pagination cursor pointing at the last note of a result page.
+
+    Results are ordered by ``(updated_at, id)`` descending, so the next page
+    starts strictly after this pair without scanning skipped rows.
+
+    Attributes:
+        updated_at: Last update timestamp of the last note on the page
+        note_id: UUID of the last note on the page (tie-breaker)
+    """
+
+    updated_at: datetime
+    note_id: UUID
+
+    @classmethod
+    def after_note(cls, note: "Note") -> "SearchCursor":
+        """Create a cursor positioned after the given note."""
+        return cls(updated_at=note.updated_at, note_id=note.id)
+
+    def encode(self) -> str:
+        """Encode the cursor as an opaque URL-safe token."""
+        raw = f"{self.updated_at.isoformat()}|{self.note_id}"
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> "SearchCursor":
+        """Decode a token produced by :meth:`encode`.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token.encode()).decode()
+            updated_at, note_id = raw.split("|", 1)
+            return cls(
+                updated_at=datetime.fromisoformat(updated_at), note_id=UUID(note_id)
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid search cursor: {str(e)}")
+
+
+@dataclass(slots=True)
 class SearchCriteria:
     """Domain entity representing search criteria for notes.
 
@@ -36,6 +87,7 @@ class SearchCriteria:
         section: Section to search in (my-notes, shared-by-me, shared-with-me)
         page: Page number for pagination (1-based)
         limit: Number of results per page
+        after: Keyset cursor; when set, results start after it instead of the offset
     """
 
     user_id: UUID
@@ -44,18 +96,24 @@ class SearchCriteria:
     section: SearchSection = SearchSection.MY_NOTES
     page: int = 1
     limit: int = 15
+    after: Optional[SearchCursor] = None
 
     def __post_init__(self):
         """Validate search criteria after initialization."""
         if self.page < 1:
             raise ValueError("Page number must be at least 1")
-        if self.limit < 1 or self.limit > 100:
+        if not 1 <= self.limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
         if not self.query and not self.tag_ids:
             raise ValueError("Either query or tag_ids must be provided")
+        if self.tag_ids and len(self.tag_ids) > MAX_TAG_FILTERS:
+            raise ValueError(
+                f"Cannot filter by more than {MAX_TAG_FILTERS} tags at once"
+            )
         if self.query is not None:
-            self.query = self.query.strip()
-            if not self.query and not self.tag_ids:
+            # Blank queries are normalized to None so later checks need no strip
+            self.query = self.query.strip() or None
+            if self.query is None and not self.tag_ids:
                 raise ValueError("Query cannot be empty if no tags provided")
 
     @property
@@ -65,11 +123,19 @@ class SearchCriteria:
 
     def has_text_search(self) -> bool:
         """Check if this criteria includes text search."""
-        return self.query is not None and len(self.query.strip()) > 0
+        return self.query is not None
 
     def has_tag_filter(self) -> bool:
         """Check if this criteria includes tag filtering."""
-        return self.tag_ids is not None and len(self.tag_ids) > 0
+        return bool(self.tag_ids)
+
+    def ranks_by_relevance(self) -> bool:
+        """Check if results are ordered by text relevance instead of recency.
+
+        Keyset cursors only describe the recency order, so a search continued
+        with a cursor stays chronological.
+        """
+        return self.has_text_search() and self.after is None
 
     @classmethod
     def from_search_request(cls, request, user_id: UUID) -> "SearchCriteria":
@@ -85,34 +151,31 @@ class SearchCriteria:
         Raises:
             ValueError: If request contains invalid data
         """
-        # Convert section string to enum
-        section_map = {
-            "my-notes": SearchSection.MY_NOTES,
-            "shared-by-me": SearchSection.SHARED_BY_ME,
-            "shared-with-me": SearchSection.SHARED_WITH_ME,
-        }
-
-        section = section_map.get(request.section)
-        if not section:
-            raise ValueError(f"Invalid section: {request.section}")
+        # Already validated as an enum by the request schema; plain strings
+        # raise ValueError here
+        section = SearchSection(request.section)
 
         # Parse tag IDs if provided
         tag_ids = None
         if request.tags:
             tag_ids = request.get_tag_ids()
 
+        # Decode keyset cursor if provided
+        after = SearchCursor.decode(request.after) if request.after else None
+
         # Create and return SearchCriteria domain entity
         return cls(
             user_id=user_id,
-            query=request.q if request.q and request.q.strip() else None,
+            query=request.q or None,
             tag_ids=tag_ids,
             section=section,
             page=request.page,
             limit=request.limit,
+            after=after,
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PaginationMetadata:
     """Domain entity representing pagination information for search results.
 
@@ -120,7 +183,7 @@ class PaginationMetadata:
     in search results.
 
     Attributes:
-        current_page: Current page number
+        current_page: Current page number; None for pages reached with a cursor
         total_pages: Total number of pages
         total_notes: Total number of notes found
         notes_per_page: Number of notes per page
@@ -128,7 +191,7 @@ class PaginationMetadata:
         has_previous: Whether there is a previous page
     """
 
-    current_page: int
+    current_page: Optional[int]
     total_pages: int
     total_notes: int
     notes_per_page: int
@@ -136,11 +199,15 @@ class PaginationMetadata:
     has_previous: bool
 
     @classmethod
+    @lru_cache(maxsize=2048)
     def calculate(
         cls, current_page: int, total_notes: int, notes_per_page: int
     ) -> "PaginationMetadata":
         """Calculate pagination metadata from basic parameters.
 
+        Results are memoized per (page, total, page size); instances are frozen,
+        so a cached one can be shared between requests.
+
         Args:
             current_page: The current page number (1-based)
             total_notes: Total number of notes found (will be converted to 0 if None)
@@ -169,8 +236,35 @@ class PaginationMetadata:
             has_previous=has_previous,
         )
 
+    @classmethod
+    def after_cursor(
+        cls, total_notes: int, notes_per_page: int, has_next: bool
+    ) -> "PaginationMetadata":
+        """Build pagination metadata for a page reached with a keyset cursor.
+
+        A cursor page has no page number, so current_page is None. It always
+        follows another page, and whether a next page exists is known from the
+        page query itself rather than from the total.
+
+        Args:
+            total_notes: Total number of notes found
+            notes_per_page: Number of notes per page
+            has_next: Whether more notes follow this page
+
+        Returns:
+            PaginationMetadata: Pagination information for the cursor page
+        """
+        return cls(
+            current_page=None,
+            total_pages=max((total_notes + notes_per_page - 1) // notes_per_page, 1),
+            total_notes=total_notes,
+            notes_per_page=notes_per_page,
+            has_next=has_next,
+            has_previous=True,
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class SearchResult:
     """Domain entity representing the result of a search operation.
 
@@ -182,12 +276,14 @@ class SearchResult:
         pagination: Pagination metadata for the search results
         criteria: The search criteria that produced these results
         search_timestamp: When the search was performed
+        next_cursor: Keyset cursor for the following page, None on the last page
     """
 
     notes: List["Note"]
     pagination: PaginationMetadata
     criteria: SearchCriteria
     search_timestamp: datetime
+    next_cursor: Optional[SearchCursor] = None
 
     def __post_init__(self):
         """Validate search result after initialization."""
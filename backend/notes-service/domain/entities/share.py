@@ -0,0 +1,35 @@
+"""Note share domain entity.
+
+This module contains the NoteShare domain entity that represents
+a note being shared with another user.
+"""
+
+from datetime import datetime
+from typing import NamedTuple
+from uuid import UUID
+
+
+class NoteShare(NamedTuple):
+    """Domain entity representing a share of a note with a user.
+
+    Shares are read-only records with a fixed set of fields, so they are
+    plain tuples rather than one dictionary per share.
+
+    Attributes:
+        id (UUID): Unique identifier of the share.
+        note_id (UUID): UUID of the shared note.
+        shared_by_user_id (UUID): Keycloak UUID of the user who shared the note.
+        shared_with_user_id (UUID): Keycloak UUID of the user who received it.
+        created_at (datetime): Timestamp when the share was created.
+
+    Example:
+        >>> share = NoteShare._make(row)
+        >>> print(share.shared_with_user_id)
+        "recipient-uuid"
+    """
+
+    id: UUID
+    note_id: UUID
+    shared_by_user_id: UUID
+    shared_with_user_id: UUID
+    created_at: datetime
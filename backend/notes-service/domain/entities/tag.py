@@ -5,11 +5,17 @@ a tag in the business domain with its rules and behaviors.
 """
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 from uuid import UUID
+from weakref import WeakValueDictionary
 
+# Live tag entities by (id, name); entries go away with their last reference
+_TAG_POOL: "WeakValueDictionary[Tuple[Optional[UUID], str], TagEntity]" = (
+    WeakValueDictionary()
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False, slots=True, weakref_slot=True)
 class TagEntity:
     """Domain entity representing a tag.
 
@@ -40,11 +46,61 @@ class TagEntity:
         Raises:
             ValueError: If tag name is empty or contains only whitespace.
         """
-        if not self.name or not self.name.strip():
+        name = self.name.strip() if self.name else ""
+        if not name:
             raise ValueError("Tag name cannot be empty or whitespace")
 
-        # Normalize the name by stripping whitespace
-        object.__setattr__(self, "name", self.name.strip())
+        # Normalize the name by stripping whitespace; strip() returns the same
+        # object when there is nothing to remove
+        if name is not self.name:
+            object.__setattr__(self, "name", name)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare tags by ID and name, short-circuiting on identity.
+
+        Args:
+            other (object): Object to compare with.
+
+        Returns:
+            bool: True if both tags have the same ID and name.
+        """
+        if self is other:
+            return True
+        if not isinstance(other, TagEntity):
+            return NotImplemented
+        return self.id == other.id and self.name == other.name
+
+    def __hash__(self) -> int:
+        """Hash on the business key without building a field tuple.
+
+        Returns:
+            int: Hash of the ID, or of the name for new tags.
+        """
+        return hash(self.id) if self.id is not None else hash(self.name)
+
+    @classmethod
+    def get(cls, id: Optional[UUID], name: str) -> "TagEntity":
+        """Return a shared tag entity for the given ID and name.
+
+        Tag entities are immutable, so equal ones are interchangeable. Notes
+        loaded together that carry the same tag reuse one instance instead of
+        each building its own.
+
+        Args:
+            id (Optional[UUID]): Unique identifier of the tag.
+            name (str): The display name of the tag.
+
+        Returns:
+            TagEntity: The pooled tag entity.
+
+        Raises:
+            ValueError: If tag name is empty or contains only whitespace.
+        """
+        key = (id, name)
+        tag = _TAG_POOL.get(key)
+        if tag is None:
+            tag = _TAG_POOL[key] = cls(id=id, name=name)
+        return tag
 
     def is_new(self) -> bool:
         """Check if this is a new tag (not yet persisted).
@@ -12,6 +12,7 @@ from uuid import UUID
 
 if TYPE_CHECKING:
     from domain.entities.note import Note
+    from domain.entities.share import NoteShare
     from sqlalchemy.orm import Session
 
 
@@ -58,6 +59,25 @@ class NoteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    async def get_note_for_owner(
+        self, db_session: Session, note_id: UUID, owner_id: UUID
+    ) -> Optional[Note]:
+        """Get a note by ID if it is owned by the user.
+
+        Args:
+            db_session (Session): SQLAlchemy database session for this operation
+            note_id (UUID): UUID of the note to retrieve
+            owner_id (UUID): UUID of the user who must own the note
+
+        Returns:
+            Optional[Note]: Note if found and owned by the user, None otherwise
+
+        Raises:
+            RepositoryError: If retrieval fails at the data layer
+        """
+        pass
+
     @abstractmethod
     async def update_note(self, db_session: Session, note: Note) -> Note:
         """Update an existing note in the repository.
@@ -248,7 +268,7 @@ class NoteRepository(ABC):
     @abstractmethod
     async def get_note_shares(
         self, db_session: Session, note_id: UUID, user_id: UUID
-    ) -> List[dict]:
+    ) -> List[NoteShare]:
         """Get all shares for a note (only for note owner).
 
         Args:
@@ -257,7 +277,7 @@ class NoteRepository(ABC):
             user_id: UUID of the user (must be note owner)
 
         Returns:
-            List[dict]: List of share information
+            List[NoteShare]: Shares of the note
 
         Raises:
             RepositoryError: If retrieval fails at the data layer
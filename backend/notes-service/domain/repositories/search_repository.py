@@ -34,7 +34,9 @@ class SearchRepository(ABC):
 
         Returns:
             Tuple[List[Note], int]: A tuple containing:
-                - List of notes matching the criteria (paginated)
+                - List of notes matching the criteria (paginated). When
+                  criteria.after is set, up to limit + 1 notes are returned;
+                  the extra note only tells that a following page exists.
                 - Total count of notes matching the criteria (for pagination)
 
         Raises:
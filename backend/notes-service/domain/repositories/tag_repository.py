@@ -33,7 +33,8 @@ class TagRepository(ABC):
             db_session (Session): Fresh database session for this operation.
 
         Returns:
-            List[TagEntity]: List of all available tag entities.
+            List[TagEntity]: List of all available tag entities sorted by
+                name, case-insensitively.
 
         Example:
             >>> with get_db_session() as db:
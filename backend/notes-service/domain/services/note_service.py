@@ -12,6 +12,7 @@ from uuid import UUID
 
 from domain.entities.note import Note
 from domain.entities.search import PaginationMetadata
+from domain.entities.share import NoteShare
 from domain.entities.tag import TagEntity
 
 if TYPE_CHECKING:
@@ -24,19 +25,19 @@ logger = logging.getLogger(__name__)
 class NoteError(Exception):
     """Base exception for note-related errors."""
 
-    pass
+    __slots__ = ()
 
 
 class NoteNotFoundError(NoteError):
     """Exception raised when a note is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class NoteAccessDeniedError(NoteError):
     """Exception raised when user doesn't have access to a note."""
 
-    pass
+    __slots__ = ()
 
 
 class NoteService:
@@ -78,7 +79,9 @@ class NoteService:
             ValueError: If title or content are invalid
             NoteError: If creation fails
         """
-        logger.info(f"Creating note for user {owner_id} with {len(tag_entities)} tags")
+        logger.info(
+            "Creating note for user %s with %d tags", owner_id, len(tag_entities)
+        )
 
         try:
             # Create note using domain entity factory
@@ -92,15 +95,15 @@ class NoteService:
             # Delegate to repository
             created_note = await self._note_repository.create_note(db_session, note)
 
-            logger.info(f"Successfully created note {created_note.id}")
+            logger.info("Successfully created note %s", created_note.id)
             return created_note
 
         except ValueError as e:
-            logger.warning(f"Invalid note data: {str(e)}")
+            logger.warning("Invalid note data: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Failed to create note: {str(e)}")
-            raise NoteError(f"Failed to create note: {str(e)}")
+            logger.error("Failed to create note: %s", e)
+            raise NoteError("Failed to create note") from e
 
     async def get_note(
         self, db_session: "Session", note_id: UUID, user_id: UUID
@@ -118,7 +121,7 @@ class NoteService:
         Raises:
             NoteNotFoundError: If note not found or user doesn't have access
         """
-        logger.info(f"Getting note {note_id} for user {user_id}")
+        logger.info("Getting note %s for user %s", note_id, user_id)
 
         try:
             note = await self._note_repository.get_note_by_id(
@@ -133,8 +136,8 @@ class NoteService:
         except NoteNotFoundError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get note {note_id}: {str(e)}")
-            raise NoteError(f"Failed to retrieve note: {str(e)}")
+            logger.error("Failed to get note %s: %s", note_id, e)
+            raise NoteError("Failed to retrieve note") from e
 
     async def update_note(
         self,
@@ -163,20 +166,19 @@ class NoteService:
             ValueError: If update data is invalid
             NoteError: If update fails
         """
-        logger.info(f"Updating note {note_id} for user {user_id}")
+        logger.info("Updating note %s for user %s", note_id, user_id)
 
         try:
-            # Get existing note (only owner can update)
-            existing_note = await self._note_repository.get_note_by_id(
+            # Get existing note (only owner can update); the lookup itself
+            # guarantees ownership
+            existing_note = await self._note_repository.get_note_for_owner(
                 db_session, note_id, user_id
             )
 
             if not existing_note:
+                await self._check_note_owner(db_session, note_id, user_id, "update")
                 raise NoteNotFoundError(f"Note {note_id} not found")
 
-            if not existing_note.is_owned_by(user_id):
-                raise NoteAccessDeniedError("Only note owner can update the note")
-
             # Apply updates using domain logic
             if title is not None or content is not None:
                 existing_note.update_content(
@@ -186,21 +188,21 @@ class NoteService:
 
             if tag_entities is not None:
                 # Replace all tags
-                existing_note.tags = tag_entities
+                existing_note.replace_tags(tag_entities)
 
             # Delegate to repository
             updated_note = await self._note_repository.update_note(
                 db_session, existing_note
             )
 
-            logger.info(f"Successfully updated note {note_id}")
+            logger.info("Successfully updated note %s", note_id)
             return updated_note
 
         except (NoteNotFoundError, NoteAccessDeniedError, ValueError):
             raise
         except Exception as e:
-            logger.error(f"Failed to update note {note_id}: {str(e)}")
-            raise NoteError(f"Failed to update note: {str(e)}")
+            logger.error("Failed to update note %s: %s", note_id, e)
+            raise NoteError("Failed to update note") from e
 
     async def delete_note(
         self, db_session: "Session", note_id: UUID, user_id: UUID
@@ -219,37 +221,27 @@ class NoteService:
             NoteNotFoundError: If note not found or user doesn't own it
             NoteError: If deletion fails
         """
-        logger.info(f"Deleting note {note_id} for user {user_id}")
+        logger.info("Deleting note %s for user %s", note_id, user_id)
 
         try:
-            # Verify ownership before deletion
-            existing_note = await self._note_repository.get_note_by_id(
-                db_session, note_id, user_id
-            )
-
-            if not existing_note:
-                raise NoteNotFoundError(f"Note {note_id} not found")
-
-            if not existing_note.is_owned_by(user_id):
-                raise NoteAccessDeniedError("Only note owner can delete the note")
-
-            # Delegate to repository
+            # The repository only deletes a note the user owns
             success = await self._note_repository.delete_note(
                 db_session, note_id, user_id
             )
 
             if success:
-                logger.info(f"Successfully deleted note {note_id}")
+                logger.info("Successfully deleted note %s", note_id)
             else:
-                logger.warning(f"Note {note_id} not found for deletion")
+                await self._check_note_owner(db_session, note_id, user_id, "delete")
+                logger.warning("Note %s not found for deletion", note_id)
 
             return success
 
         except (NoteNotFoundError, NoteAccessDeniedError):
             raise
         except Exception as e:
-            logger.error(f"Failed to delete note {note_id}: {str(e)}")
-            raise NoteError(f"Failed to delete note: {str(e)}")
+            logger.error("Failed to delete note %s: %s", note_id, e)
+            raise NoteError("Failed to delete note") from e
 
     async def get_user_notes_paginated(
         self,
@@ -286,14 +278,14 @@ class NoteService:
                 current_page=page, total_notes=total_count, notes_per_page=limit
             )
 
-            logger.info(f"Retrieved {len(notes)} user notes for user {user_id}")
+            logger.info("Retrieved %d user notes for user %s", len(notes), user_id)
             return notes, pagination
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get user notes: {str(e)}")
-            raise NoteError(f"Failed to retrieve user notes: {str(e)}")
+            logger.error("Failed to get user notes: %s", e)
+            raise NoteError("Failed to retrieve user notes") from e
 
     async def get_my_notes_paginated(
         self,
@@ -330,14 +322,14 @@ class NoteService:
                 current_page=page, total_notes=total_count, notes_per_page=limit
             )
 
-            logger.info(f"Retrieved {len(notes)} private notes for user {user_id}")
+            logger.info("Retrieved %d private notes for user %s", len(notes), user_id)
             return notes, pagination
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get private notes: {str(e)}")
-            raise NoteError(f"Failed to retrieve private notes: {str(e)}")
+            logger.error("Failed to get private notes: %s", e)
+            raise NoteError("Failed to retrieve private notes") from e
 
     async def get_notes_shared_by_me_paginated(
         self,
@@ -374,14 +366,14 @@ class NoteService:
                 current_page=page, total_notes=total_count, notes_per_page=limit
             )
 
-            logger.info(f"Retrieved {len(notes)} notes shared by user {user_id}")
+            logger.info("Retrieved %d notes shared by user %s", len(notes), user_id)
             return notes, pagination
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get notes shared by user: {str(e)}")
-            raise NoteError(f"Failed to retrieve notes shared by user: {str(e)}")
+            logger.error("Failed to get notes shared by user: %s", e)
+            raise NoteError("Failed to retrieve notes shared by user") from e
 
     async def get_notes_shared_with_me_paginated(
         self,
@@ -418,14 +410,14 @@ class NoteService:
                 current_page=page, total_notes=total_count, notes_per_page=limit
             )
 
-            logger.info(f"Retrieved {len(notes)} notes shared with user {user_id}")
+            logger.info("Retrieved %d notes shared with user %s", len(notes), user_id)
             return notes, pagination
 
         except ValueError:
             raise
         except Exception as e:
-            logger.error(f"Failed to get notes shared with user: {str(e)}")
-            raise NoteError(f"Failed to retrieve notes shared with user: {str(e)}")
+            logger.error("Failed to get notes shared with user: %s", e)
+            raise NoteError("Failed to retrieve notes shared with user") from e
 
     async def share_note_with_users(
         self,
@@ -453,35 +445,26 @@ class NoteService:
         if not shared_with_user_ids:
             raise ValueError("Must specify at least one user to share with")
 
-        logger.info(f"Sharing note {note_id} with {len(shared_with_user_ids)} users")
+        logger.info("Sharing note %s with %d users", note_id, len(shared_with_user_ids))
 
         try:
-            # Verify ownership
-            note = await self._note_repository.get_note_by_id(
-                db_session, note_id, owner_id
-            )
-
-            if not note:
-                raise NoteNotFoundError(f"Note {note_id} not found")
-
-            if not note.is_owned_by(owner_id):
-                raise NoteAccessDeniedError("Only note owner can share the note")
-
-            # Delegate to repository
+            # The repository verifies ownership in the same round-trip
             success = await self._note_repository.share_note(
                 db_session, note_id, owner_id, shared_with_user_ids
             )
 
             if success:
-                logger.info(f"Successfully shared note {note_id}")
+                logger.info("Successfully shared note %s", note_id)
+            else:
+                await self._check_note_owner(db_session, note_id, owner_id, "share")
 
             return success
 
         except (NoteNotFoundError, NoteAccessDeniedError, ValueError):
             raise
         except Exception as e:
-            logger.error(f"Failed to share note {note_id}: {str(e)}")
-            raise NoteError(f"Failed to share note: {str(e)}")
+            logger.error("Failed to share note %s: %s", note_id, e)
+            raise NoteError("Failed to share note") from e
 
     async def unshare_note_with_user(
         self,
@@ -505,39 +488,31 @@ class NoteService:
             NoteNotFoundError: If note not found or user doesn't own it
             NoteError: If unsharing fails
         """
-        logger.info(f"Unsharing note {note_id} with user {shared_with_user_id}")
+        logger.info("Unsharing note %s with user %s", note_id, shared_with_user_id)
 
         try:
-            # Verify ownership
-            note = await self._note_repository.get_note_by_id(
-                db_session, note_id, owner_id
-            )
-
-            if not note:
-                raise NoteNotFoundError(f"Note {note_id} not found")
-
-            if not note.is_owned_by(owner_id):
-                raise NoteAccessDeniedError("Only note owner can unshare the note")
-
-            # Delegate to repository
+            # Only the owner shares a note, so matching shared_by_user_id
+            # checks ownership in the same statement
             success = await self._note_repository.unshare_note(
                 db_session, note_id, owner_id, shared_with_user_id
             )
 
             if success:
-                logger.info(f"Successfully unshared note {note_id}")
+                logger.info("Successfully unshared note %s", note_id)
+            else:
+                await self._check_note_owner(db_session, note_id, owner_id, "unshare")
 
             return success
 
         except (NoteNotFoundError, NoteAccessDeniedError):
             raise
         except Exception as e:
-            logger.error(f"Failed to unshare note {note_id}: {str(e)}")
-            raise NoteError(f"Failed to unshare note: {str(e)}")
+            logger.error("Failed to unshare note %s: %s", note_id, e)
+            raise NoteError("Failed to unshare note") from e
 
     async def get_note_shares(
         self, db_session: "Session", note_id: UUID, user_id: UUID
-    ) -> List[dict]:
+    ) -> List[NoteShare]:
         """Get all shares for a note.
 
         Args:
@@ -546,13 +521,13 @@ class NoteService:
             user_id: UUID of the user (must be note owner)
 
         Returns:
-            List of share information
+            List[NoteShare]: Shares of the note
 
         Raises:
             NoteNotFoundError: If note not found or user doesn't own it
             NoteError: If retrieval fails
         """
-        logger.info(f"Getting shares for note {note_id}")
+        logger.info("Getting shares for note %s", note_id)
 
         try:
             # Verify ownership is handled by repository
@@ -560,14 +535,41 @@ class NoteService:
                 db_session, note_id, user_id
             )
 
-            logger.info(f"Retrieved {len(shares)} shares for note {note_id}")
+            logger.info("Retrieved %d shares for note %s", len(shares), note_id)
             return shares
 
         except Exception as e:
-            logger.error(f"Failed to get note shares: {str(e)}")
-            raise NoteError(f"Failed to retrieve note shares: {str(e)}")
+            logger.error("Failed to get note shares: %s", e)
+            raise NoteError("Failed to retrieve note shares") from e
+
+    async def _check_note_owner(
+        self, db_session: "Session", note_id: UUID, user_id: UUID, action: str
+    ) -> None:
+        """Explain an owner-gated operation that affected nothing.
+
+        Mutations check ownership in their own statement, so the note is only
+        looked up again on this failure path.
+
+        Args:
+            db_session: Database session for this operation
+            note_id: UUID of the note
+            user_id: UUID of the user attempting the operation
+            action: Name of the attempted operation, used in the error message
+
+        Raises:
+            NoteNotFoundError: If note not found or not accessible to the user
+            NoteAccessDeniedError: If the user can access but does not own the note
+        """
+        note = await self._note_repository.get_note_by_id(db_session, note_id, user_id)
+
+        if not note:
+            raise NoteNotFoundError(f"Note {note_id} not found")
+
+        if not note.is_owned_by(user_id):
+            raise NoteAccessDeniedError(f"Only note owner can {action} the note")
 
-    def _validate_pagination(self, page: int, limit: int) -> None:
+    @staticmethod
+    def _validate_pagination(page: int, limit: int) -> None:
         """Validate pagination parameters.
 
         Args:
@@ -579,5 +581,5 @@ class NoteService:
         """
         if page < 1:
             raise ValueError("Page number must be at least 1")
-        if limit < 1 or limit > 100:
+        if not 1 <= limit <= 100:
             raise ValueError("Limit must be between 1 and 100")
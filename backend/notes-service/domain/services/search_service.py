@@ -8,7 +8,12 @@ import logging
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from domain.entities.search import PaginationMetadata, SearchCriteria, SearchResult
+from domain.entities.search import (
+    PaginationMetadata,
+    SearchCriteria,
+    SearchCursor,
+    SearchResult,
+)
 from domain.repositories.search_repository import SearchRepository
 
 if TYPE_CHECKING:
@@ -39,10 +44,11 @@ class SearchService:
         """Search for notes based on the provided criteria.
 
         This method orchestrates the search operation by:
-        1. Validating the search criteria
-        2. Delegating to the repository for data retrieval
-        3. Calculating pagination metadata
-        4. Creating and returning the search result
+        1. Delegating to the repository for data retrieval
+        2. Calculating pagination metadata and the next keyset cursor
+        3. Creating and returning the search result
+
+        The criteria are validated once, when SearchCriteria is constructed.
 
         Args:
             db_session (Session): SQLAlchemy database session for this operation.
@@ -55,10 +61,16 @@ class SearchService:
             ValueError: If search criteria are invalid.
             SearchError: If search operation fails.
         """
-        logger.info(
-            f"Performing search for user {criteria.user_id} with query '{criteria.query}' "
-            f"and {len(criteria.tag_ids) if criteria.tag_ids else 0} tags in section {criteria.section.value}"
-        )
+        # The tag count and section lookup are only worth computing when logged
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Performing search for user %s with query '%s' and %d tags in "
+                "section %s",
+                criteria.user_id,
+                criteria.query,
+                len(criteria.tag_ids) if criteria.tag_ids else 0,
+                criteria.section.value,
+            )
 
         # Get notes and total count from repository
         notes, total_count = await self._search_repository.search_notes(
@@ -66,10 +78,28 @@ class SearchService:
         )
 
         # Calculate pagination metadata
-        pagination = PaginationMetadata.calculate(
-            current_page=criteria.page,
-            total_notes=total_count,
-            notes_per_page=criteria.limit,
+        if criteria.after is None:
+            pagination = PaginationMetadata.calculate(
+                current_page=criteria.page,
+                total_notes=total_count,
+                notes_per_page=criteria.limit,
+            )
+        else:
+            # The page number is ignored with a cursor; the repository fetched
+            # one extra note to tell whether a following page exists
+            has_next = len(notes) > criteria.limit
+            notes = notes[: criteria.limit]
+            pagination = PaginationMetadata.after_cursor(
+                total_notes=total_count,
+                notes_per_page=criteria.limit,
+                has_next=has_next,
+            )
+
+        # Relevance-ranked pages can only be continued by page number
+        next_cursor = (
+            SearchCursor.after_note(notes[-1])
+            if pagination.has_next and notes and not criteria.ranks_by_relevance()
+            else None
         )
 
         # Create and return search result
@@ -78,41 +108,25 @@ class SearchService:
             pagination=pagination,
             criteria=criteria,
             search_timestamp=datetime.utcnow(),
+            next_cursor=next_cursor,
         )
 
         logger.info(
-            f"Search completed: found {len(notes)} notes out of {total_count} total "
-            f"for user {criteria.user_id} on page {criteria.page}"
+            "Search completed: found %d notes out of %d total for user %s on page %d",
+            len(notes),
+            total_count,
+            criteria.user_id,
+            criteria.page,
         )
 
         return search_result
 
-    def validate_search_criteria(self, criteria: SearchCriteria) -> None:
-        """Validate search criteria according to business rules.
-
-        This method ensures the search criteria meet all business requirements
-        before proceeding with the search operation.
-
-        Args:
-            criteria (SearchCriteria): The search criteria to validate.
-
-        Raises:
-            ValueError: If criteria are invalid according to business rules.
-        """
-        # Validation is already handled in SearchCriteria.__post_init__
-        # but we can add additional business rules here if needed
-
-        if criteria.has_tag_filter() and len(criteria.tag_ids) > 10:
-            raise ValueError("Cannot filter by more than 10 tags at once")
-
-        logger.debug(
-            f"Search criteria validated successfully for user {criteria.user_id}"
-        )
-
 
 class SearchError(Exception):
     """Exception raised when search operations fail."""
 
+    __slots__ = ("original_error",)
+
     def __init__(self, message: str, original_error: Optional[Exception] = None):
         """Initialize search error.
 
@@ -55,7 +55,6 @@ class TagService:
             ...     print([tag.name for tag in tags])
             ['personal', 'work']
         """
-        tags = await self._tag_repository.get_all(db_session)
-
-        # Business rule: Return tags sorted by name for consistent ordering
-        return sorted(tags, key=lambda tag: tag.name.lower())
+        # Business rule: Return tags sorted by name for consistent ordering.
+        # The repository returns them already ordered.
+        return await self._tag_repository.get_all(db_session)
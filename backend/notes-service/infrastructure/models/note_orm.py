@@ -19,9 +19,9 @@ import uuid
 from datetime import datetime
 
 from infrastructure.models.base import Base
-from sqlalchemy import Boolean, Column, DateTime, String, Text
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Computed, DateTime, String, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 
 
 class NoteORM(Base):
@@ -38,18 +38,21 @@ class NoteORM(Base):
         created_at (datetime): Timestamp when note was created.
         updated_at (datetime): Timestamp when note was last updated.
         is_deleted (bool): Soft delete flag, defaults to False.
-        search_vector (str): PostgreSQL tsvector for full-text search.
+        search_vector (str): Generated PostgreSQL tsvector over title and content
+            (deferred; not loaded with the row).
         tags (List[TagORM]): Many-to-many relationship with tags.
         shares (List[NoteShareORM]): One-to-many relationship with note shares.
 
     Table Schema:
         - Table name: 'notes'
         - Primary key: id (UUID)
-        - Indexes: id (primary key index)
+        - Indexes: id (primary key index), search_vector (GIN),
+          title/content (GIN trigram), (owner_id, updated_at, id) partial on
+          non-deleted notes
 
     Relationships:
         - tags: Many-to-many with TagORM through note_tags association table
-        - shares: One-to-many with NoteShareORM (backref from NoteShareORM)
+        - shares: One-to-many with NoteShareORM
 
     Example:
         >>> note_orm = NoteORM(title="Work Note", content="Important task", owner_id="user-uuid")
@@ -112,8 +115,20 @@ class NoteORM(Base):
         comment="Soft delete flag, defaults to False",
     )
 
-    # Full-text search support
-    search_vector = Column(Text, comment="PostgreSQL tsvector for full-text search")
+    # Full-text search support, generated by PostgreSQL from title and content
+    # Deferred: only used in SQL predicates, so loads skip fetching and
+    # decoding the (content-sized) vector for every row
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('simple', COALESCE(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', COALESCE(content, '')), 'B')",
+                persisted=True,
+            ),
+            comment="PostgreSQL tsvector for full-text search",
+        )
+    )
 
     # Many-to-many relationship with tags
     # Import is deferred to avoid circular import issues
@@ -121,8 +136,9 @@ class NoteORM(Base):
         "TagORM", secondary="note_tags", back_populates="notes", lazy="select"
     )
 
-    # Note: shares relationship is defined as backref in NoteShareORM
-    # to avoid circular imports. It will be available as self.shares
+    # One-to-many relationship with shares. Lists never read it, so it stays
+    # lazy; queries that need it opt in with selectinload(NoteORM.shares)
+    shares = relationship("NoteShareORM", back_populates="note", lazy="select")
 
     def __repr__(self) -> str:
         """String representation for debugging.
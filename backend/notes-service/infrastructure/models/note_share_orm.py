@@ -42,10 +42,11 @@ class NoteShareORM(Base):
         - Table name: 'note_shares'
         - Primary key: id (UUID)
         - Foreign key: note_id -> notes.id
-        - Indexes: id (primary key index)
+        - Indexes: id (primary key index), (shared_by_user_id, note_id),
+          (shared_with_user_id, note_id)
 
     Relationships:
-        - note: Many-to-one with NoteORM (creates backref 'shares' on NoteORM)
+        - note: Many-to-one with NoteORM (inverse of NoteORM.shares)
 
     Example:
         >>> share_orm = NoteShareORM(
@@ -103,9 +104,8 @@ class NoteShareORM(Base):
         comment="Timestamp when share was created",
     )
 
-    # Many-to-one relationship with note
-    # This creates a backref 'shares' on NoteORM automatically
-    note = relationship("NoteORM", backref="shares", lazy="select")
+    # Many-to-one relationship with note, paired with NoteORM.shares
+    note = relationship("NoteORM", back_populates="shares", lazy="select")
 
     def __repr__(self) -> str:
         """String representation for debugging.
@@ -40,7 +40,7 @@ class TagORM(Base):
         - Table name: 'tags'
         - Primary key: id (UUID)
         - Unique constraint: name
-        - Indexes: id (primary key index), name (unique index)
+        - Indexes: id (primary key index), name (unique index), lower(name)
 
     Relationships:
         - notes: Many-to-many with NoteORM through note_tags association table
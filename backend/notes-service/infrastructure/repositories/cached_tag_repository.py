@@ -0,0 +1,63 @@
+"""Read-through cached implementation of the tag repository.
+
+This module contains a TagRepository decorator that keeps the tag list in
+process memory for a short time, in front of any concrete repository.
+"""
+
+import asyncio
+from typing import List
+
+from cachetools import TTLCache
+from domain.entities.tag import TagEntity
+from domain.repositories.tag_repository import TagRepository
+from sqlalchemy.orm import Session
+
+
+class CachedTagRepository(TagRepository):
+    """Tag repository that caches the full tag list with a TTL.
+
+    Wraps another TagRepository and serves get_all from memory until the
+    entry expires, so resolving tag names does not cost a database round-trip
+    per request. Concurrent misses are coalesced: one caller reloads the list
+    while the others wait for it instead of querying as well. This service
+    never writes tags, so expiry is the only invalidation needed.
+
+    Example:
+        >>> repository = CachedTagRepository(SqlAlchemyTagRepository(), ttl=60)
+        >>> with get_db_session() as db:
+        ...     tags = await repository.get_all(db)
+        ...     print(len(tags))
+        5
+    """
+
+    def __init__(self, tag_repository: TagRepository, ttl: int) -> None:
+        """Initialize the cache around a concrete repository.
+
+        Args:
+            tag_repository (TagRepository): Repository used on cache misses.
+            ttl (int): Seconds a cached tag list stays valid.
+        """
+        self._tag_repository = tag_repository
+        self._cache: TTLCache = TTLCache(maxsize=1, ttl=ttl)
+        self._reload_lock = asyncio.Lock()
+
+    async def get_all(self, db_session: Session) -> List[TagEntity]:
+        """Retrieve all tags, from the cache when it is fresh.
+
+        Args:
+            db_session (Session): Fresh database session, used on a cache miss.
+
+        Returns:
+            List[TagEntity]: List of all available tag entities.
+        """
+        tags = self._cache.get("tags")
+        if tags is None:
+            async with self._reload_lock:
+                # Another request may have reloaded while this one waited
+                tags = self._cache.get("tags")
+                if tags is None:
+                    tags = await self._tag_repository.get_all(db_session)
+                    self._cache["tags"] = tags
+
+        # Tag entities are immutable; only the list itself is copied
+        return list(tags)
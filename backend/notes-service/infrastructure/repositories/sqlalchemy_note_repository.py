@@ -12,17 +12,47 @@ from typing import List, Optional, Tuple
 from uuid import UUID
 
 from domain.entities.note import Note
+from domain.entities.share import NoteShare
 from domain.entities.tag import TagEntity
 from domain.repositories.note_repository import NoteRepository
 from infrastructure.models.associations import note_tags
 from infrastructure.models.note_orm import NoteORM
 from infrastructure.models.note_share_orm import NoteShareORM
 from infrastructure.models.tag_orm import TagORM
-from sqlalchemy import distinct, func, or_
-from sqlalchemy.orm import Session
+from infrastructure.repositories.worker_thread import run_in_worker_thread
+from sqlalchemy import bindparam, distinct, func, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, selectinload
 
 logger = logging.getLogger(__name__)
 
+# Ownership lookup shared by update/delete/share operations. Built once as a
+# lambda statement so SQLAlchemy caches its compiled form across requests.
+_owned_note_stmt = lambda_stmt(
+    lambda: select(NoteORM).where(
+        NoteORM.id == bindparam("note_id"),
+        NoteORM.owner_id == bindparam("owner_id"),
+        ~NoteORM.is_deleted,
+    )
+)
+
+# Read access check for a single note: owned by the user or shared with them.
+# Cached the same way, as it backs every single-note read.
+_accessible_note_stmt = lambda_stmt(
+    lambda: select(NoteORM).where(
+        NoteORM.id == bindparam("note_id"),
+        ~NoteORM.is_deleted,
+        or_(
+            NoteORM.owner_id == bindparam("user_id"),
+            NoteORM.id.in_(
+                select(NoteShareORM.note_id).where(
+                    NoteShareORM.shared_with_user_id == bindparam("user_id")
+                )
+            ),
+        ),
+    )
+)
+
 
 class SQLAlchemyNoteRepository(NoteRepository):
     """SQLAlchemy implementation of the note repository.
@@ -32,10 +62,12 @@ class SQLAlchemyNoteRepository(NoteRepository):
 
     NOTE: This repository does not store the session internally.
     Each method receives a fresh session to ensure proper transaction management
-    and avoid session leaks.
+    and avoid session leaks. The session is synchronous, so public methods run
+    in a worker thread to keep the event loop free during queries.
     """
 
-    async def create_note(self, db_session: Session, note: Note) -> Note:
+    @run_in_worker_thread
+    def create_note(self, db_session: Session, note: Note) -> Note:
         """Create a new note in the repository.
 
         Args:
@@ -75,7 +107,8 @@ class SQLAlchemyNoteRepository(NoteRepository):
             logger.error(f"Failed to create note: {str(e)}")
             raise
 
-    async def get_note_by_id(
+    @run_in_worker_thread
+    def get_note_by_id(
         self, db_session: Session, note_id: UUID, user_id: UUID
     ) -> Optional[Note]:
         """Get a note by ID if user has access to it.
@@ -93,22 +126,9 @@ class SQLAlchemyNoteRepository(NoteRepository):
         """
         try:
             logger.info(f"Looking for note {note_id} accessible by user {user_id}")
-            note_orm = (
-                db_session.query(NoteORM)
-                .filter(
-                    NoteORM.id == note_id,
-                    ~NoteORM.is_deleted,
-                    or_(
-                        NoteORM.owner_id == user_id,
-                        NoteORM.id.in_(
-                            db_session.query(NoteShareORM.note_id).filter(
-                                NoteShareORM.shared_with_user_id == user_id
-                            )
-                        ),
-                    ),
-                )
-                .first()
-            )
+            note_orm = db_session.execute(
+                _accessible_note_stmt, {"note_id": note_id, "user_id": user_id}
+            ).scalar_one_or_none()
 
             if not note_orm:
                 logger.info(
@@ -123,7 +143,38 @@ class SQLAlchemyNoteRepository(NoteRepository):
             logger.error(f"Failed to get note {note_id}: {str(e)}")
             raise
 
-    async def update_note(self, db_session: Session, note: Note) -> Note:
+    @run_in_worker_thread
+    def get_note_for_owner(
+        self, db_session: Session, note_id: UUID, owner_id: UUID
+    ) -> Optional[Note]:
+        """Get a note by ID if it is owned by the user.
+
+        Args:
+            db_session (Session): Database session.
+            note_id (UUID): The ID of the note to retrieve.
+            owner_id (UUID): The ID of the user who must own the note.
+
+        Returns:
+            Optional[Note]: The note if found and owned by the user, None otherwise.
+
+        Raises:
+            RepositoryError: If there's an error retrieving the note.
+        """
+        try:
+            note_orm = self._get_owned_note(db_session, note_id, owner_id)
+
+            if not note_orm:
+                logger.info(f"Note {note_id} not found or not owned by user {owner_id}")
+                return None
+
+            return self._orm_to_domain_entity(note_orm)
+
+        except Exception as e:
+            logger.error(f"Failed to get note {note_id}: {str(e)}")
+            raise
+
+    @run_in_worker_thread
+    def update_note(self, db_session: Session, note: Note) -> Note:
         """Update an existing note in the repository.
 
         Args:
@@ -139,15 +190,7 @@ class SQLAlchemyNoteRepository(NoteRepository):
         """
         try:
             logger.info(f"Updating note {note.id} for owner {note.owner_id}")
-            db_note = (
-                db_session.query(NoteORM)
-                .filter(
-                    NoteORM.id == note.id,
-                    NoteORM.owner_id == note.owner_id,
-                    ~NoteORM.is_deleted,
-                )
-                .first()
-            )
+            db_note = self._get_owned_note(db_session, note.id, note.owner_id)
 
             if not db_note:
                 logger.warning(
@@ -179,9 +222,8 @@ class SQLAlchemyNoteRepository(NoteRepository):
             logger.error(f"Failed to update note {note.id}: {str(e)}")
             raise
 
-    async def delete_note(
-        self, db_session: Session, note_id: UUID, user_id: UUID
-    ) -> bool:
+    @run_in_worker_thread
+    def delete_note(self, db_session: Session, note_id: UUID, user_id: UUID) -> bool:
         """Soft delete a note (mark as deleted).
 
         Args:
@@ -196,31 +238,29 @@ class SQLAlchemyNoteRepository(NoteRepository):
             RepositoryError: If there's an error deleting the note.
         """
         try:
-            db_note = (
-                db_session.query(NoteORM)
-                .filter(
+            # Ownership is part of the UPDATE itself, so the note is not
+            # loaded first; a zero rowcount means missing, deleted or not owned
+            result = db_session.execute(
+                update(NoteORM)
+                .where(
                     NoteORM.id == note_id,
                     NoteORM.owner_id == user_id,
                     ~NoteORM.is_deleted,
                 )
-                .first()
+                .values(is_deleted=True, updated_at=datetime.utcnow())
+                .execution_options(synchronize_session=False)
             )
-
-            if not db_note:
-                return False
-
-            db_note.is_deleted = True
-            db_note.updated_at = datetime.utcnow()
             db_session.commit()
 
-            return True
+            return result.rowcount > 0
 
         except Exception as e:
             db_session.rollback()
             logger.error(f"Failed to delete note {note_id}: {str(e)}")
             raise
 
-    async def get_user_notes(
+    @run_in_worker_thread
+    def get_user_notes(
         self,
         db_session: Session,
         user_id: UUID,
@@ -253,35 +293,16 @@ class SQLAlchemyNoteRepository(NoteRepository):
 
             # Add tag filtering if provided
             if tag_ids:
-                # tag_ids are already UUID objects, no need to convert to strings
-                base_query = (
-                    base_query.join(note_tags)
-                    .filter(note_tags.c.tag_id.in_(tag_ids))
-                    .group_by(NoteORM.id)
-                    .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
-                )
+                base_query = self._apply_tag_filter(db_session, base_query, tag_ids)
 
-            # Get total count
-            total_count = base_query.count()
-
-            # Get notes for current page
-            notes_orm = (
-                base_query.order_by(NoteORM.updated_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
-
-            # Convert to domain entities
-            notes = [self._orm_to_domain_entity(note_orm) for note_orm in notes_orm]
-
-            return notes, total_count
+            return self._fetch_page(base_query, offset, limit)
 
         except Exception as e:
             logger.error(f"Failed to get user notes for {user_id}: {str(e)}")
             raise
 
-    async def get_my_notes(
+    @run_in_worker_thread
+    def get_my_notes(
         self,
         db_session: Session,
         user_id: UUID,
@@ -308,50 +329,29 @@ class SQLAlchemyNoteRepository(NoteRepository):
             offset = (page - 1) * limit
 
             # Get note IDs that are shared (to exclude them)
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id)
-                .filter(NoteShareORM.shared_by_user_id == user_id)
-                .subquery()
+            shared_note_ids = select(NoteShareORM.note_id).where(
+                NoteShareORM.shared_by_user_id == user_id
             )
 
             # Base query for user's private notes
             base_query = db_session.query(NoteORM).filter(
                 NoteORM.owner_id == user_id,
                 ~NoteORM.is_deleted,
-                ~NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
+                ~NoteORM.id.in_(shared_note_ids),
             )
 
             # Add tag filtering if provided
             if tag_ids:
-                # tag_ids are already UUID objects, no need to convert to strings
-                base_query = (
-                    base_query.join(note_tags)
-                    .filter(note_tags.c.tag_id.in_(tag_ids))
-                    .group_by(NoteORM.id)
-                    .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
-                )
-
-            # Get total count
-            total_count = base_query.count()
-
-            # Get notes for current page
-            notes_orm = (
-                base_query.order_by(NoteORM.updated_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
-
-            # Convert to domain entities
-            notes = [self._orm_to_domain_entity(note_orm) for note_orm in notes_orm]
+                base_query = self._apply_tag_filter(db_session, base_query, tag_ids)
 
-            return notes, total_count
+            return self._fetch_page(base_query, offset, limit)
 
         except Exception as e:
             logger.error(f"Failed to get my notes for {user_id}: {str(e)}")
             raise
 
-    async def get_notes_shared_by_me(
+    @run_in_worker_thread
+    def get_notes_shared_by_me(
         self,
         db_session: Session,
         user_id: UUID,
@@ -378,50 +378,29 @@ class SQLAlchemyNoteRepository(NoteRepository):
             offset = (page - 1) * limit
 
             # Get notes that are owned by user AND shared
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id)
-                .filter(NoteShareORM.shared_by_user_id == user_id)
-                .subquery()
+            shared_note_ids = select(NoteShareORM.note_id).where(
+                NoteShareORM.shared_by_user_id == user_id
             )
 
             # Base query
             base_query = db_session.query(NoteORM).filter(
                 NoteORM.owner_id == user_id,
                 ~NoteORM.is_deleted,
-                NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
+                NoteORM.id.in_(shared_note_ids),
             )
 
             # Add tag filtering if provided
             if tag_ids:
-                # tag_ids are already UUID objects, no need to convert to strings
-                base_query = (
-                    base_query.join(note_tags)
-                    .filter(note_tags.c.tag_id.in_(tag_ids))
-                    .group_by(NoteORM.id)
-                    .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
-                )
-
-            # Get total count
-            total_count = base_query.count()
-
-            # Get notes for current page
-            notes_orm = (
-                base_query.order_by(NoteORM.updated_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
+                base_query = self._apply_tag_filter(db_session, base_query, tag_ids)
 
-            # Convert to domain entities
-            notes = [self._orm_to_domain_entity(note_orm) for note_orm in notes_orm]
-
-            return notes, total_count
+            return self._fetch_page(base_query, offset, limit)
 
         except Exception as e:
             logger.error(f"Failed to get notes shared by {user_id}: {str(e)}")
             raise
 
-    async def get_notes_shared_with_me(
+    @run_in_worker_thread
+    def get_notes_shared_with_me(
         self,
         db_session: Session,
         user_id: UUID,
@@ -448,49 +427,28 @@ class SQLAlchemyNoteRepository(NoteRepository):
             offset = (page - 1) * limit
 
             # Get notes shared WITH user
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id)
-                .filter(NoteShareORM.shared_with_user_id == user_id)
-                .subquery()
+            shared_note_ids = select(NoteShareORM.note_id).where(
+                NoteShareORM.shared_with_user_id == user_id
             )
 
             # Base query
             base_query = db_session.query(NoteORM).filter(
                 ~NoteORM.is_deleted,
-                NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
+                NoteORM.id.in_(shared_note_ids),
             )
 
             # Add tag filtering if provided
             if tag_ids:
-                # tag_ids are already UUID objects, no need to convert to strings
-                base_query = (
-                    base_query.join(note_tags)
-                    .filter(note_tags.c.tag_id.in_(tag_ids))
-                    .group_by(NoteORM.id)
-                    .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
-                )
-
-            # Get total count
-            total_count = base_query.count()
-
-            # Get notes for current page
-            notes_orm = (
-                base_query.order_by(NoteORM.updated_at.desc())
-                .offset(offset)
-                .limit(limit)
-                .all()
-            )
-
-            # Convert to domain entities
-            notes = [self._orm_to_domain_entity(note_orm) for note_orm in notes_orm]
+                base_query = self._apply_tag_filter(db_session, base_query, tag_ids)
 
-            return notes, total_count
+            return self._fetch_page(base_query, offset, limit)
 
         except Exception as e:
             logger.error(f"Failed to get notes shared with {user_id}: {str(e)}")
             raise
 
-    async def share_note(
+    @run_in_worker_thread
+    def share_note(
         self,
         db_session: Session,
         note_id: UUID,
@@ -512,39 +470,43 @@ class SQLAlchemyNoteRepository(NoteRepository):
             RepositoryError: If there's an error sharing the note.
         """
         try:
-            # Verify note exists and is owned by user
-            note_exists = (
-                db_session.query(NoteORM)
-                .filter(
+            # Verify ownership without loading the note itself
+            owned_note_id = db_session.execute(
+                select(NoteORM.id).where(
                     NoteORM.id == note_id,
                     NoteORM.owner_id == shared_by_user_id,
                     ~NoteORM.is_deleted,
                 )
-                .first()
-            )
+            ).scalar_one_or_none()
 
-            if not note_exists:
+            if owned_note_id is None:
                 return False
 
-            # Create shares for each user
-            for shared_with_user_id in shared_with_user_ids:
-                # Check if already shared
-                existing_share = (
-                    db_session.query(NoteShareORM)
-                    .filter(
-                        NoteShareORM.note_id == note_id,
-                        NoteShareORM.shared_with_user_id == shared_with_user_id,
-                    )
-                    .first()
-                )
+            # Keycloak IDs may arrive as strings; compare as UUIDs and keep
+            # the first occurrence of each recipient
+            recipient_ids = dict.fromkeys(
+                UUID(str(shared_with_user_id))
+                for shared_with_user_id in shared_with_user_ids
+            )
 
-                if not existing_share:
-                    db_share = NoteShareORM(
-                        note_id=note_id,
-                        shared_by_user_id=shared_by_user_id,
-                        shared_with_user_id=shared_with_user_id,
-                    )
-                    db_session.add(db_share)
+            # One batched INSERT for all recipients; existing shares are left
+            # alone by the UNIQUE (note_id, shared_with_user_id) constraint
+            db_session.execute(
+                insert(NoteShareORM).on_conflict_do_nothing(
+                    index_elements=[
+                        NoteShareORM.note_id,
+                        NoteShareORM.shared_with_user_id,
+                    ]
+                ),
+                [
+                    {
+                        "note_id": note_id,
+                        "shared_by_user_id": shared_by_user_id,
+                        "shared_with_user_id": shared_with_uuid,
+                    }
+                    for shared_with_uuid in recipient_ids
+                ],
+            )
 
             db_session.commit()
             return True
@@ -554,7 +516,8 @@ class SQLAlchemyNoteRepository(NoteRepository):
             logger.error(f"Failed to share note {note_id}: {str(e)}")
             raise
 
-    async def unshare_note(
+    @run_in_worker_thread
+    def unshare_note(
         self,
         db_session: Session,
         note_id: UUID,
@@ -585,55 +548,124 @@ class SQLAlchemyNoteRepository(NoteRepository):
             logger.error(f"Failed to unshare note {note_id}: {str(e)}")
             raise
 
-    async def get_note_shares(
+    @run_in_worker_thread
+    def get_note_shares(
         self, db_session: Session, note_id: UUID, user_id: UUID
-    ) -> List[dict]:
+    ) -> List[NoteShare]:
         """Get all shares for a note (only for note owner)."""
         try:
-            # Verify user owns the note
-            note_exists = (
-                db_session.query(NoteORM)
-                .filter(
+            # Verify ownership and fetch shares in one round-trip. Only the
+            # share columns are selected, so no ORM objects are built.
+            rows = db_session.execute(
+                select(
+                    NoteORM.id,
+                    NoteShareORM.id,
+                    NoteShareORM.note_id,
+                    NoteShareORM.shared_by_user_id,
+                    NoteShareORM.shared_with_user_id,
+                    NoteShareORM.created_at,
+                )
+                .outerjoin(NoteShareORM, NoteShareORM.note_id == NoteORM.id)
+                .where(
                     NoteORM.id == note_id,
                     NoteORM.owner_id == user_id,
                     ~NoteORM.is_deleted,
                 )
-                .first()
             )
 
-            if not note_exists:
-                return []
-
-            # Get all shares
-            shares = (
-                db_session.query(NoteShareORM)
-                .filter(NoteShareORM.note_id == note_id)
-                .all()
-            )
-
-            # Convert to dict format
-            return [
-                {
-                    "id": str(share.id),
-                    "note_id": str(share.note_id),
-                    "shared_by_user_id": share.shared_by_user_id,
-                    "shared_with_user_id": share.shared_with_user_id,
-                    "created_at": share.created_at,
-                }
-                for share in shares
-            ]
+            # No rows means the note is missing or not owned by the user;
+            # an owned note without shares yields a single row with no share.
+            return [NoteShare._make(row[1:]) for row in rows if row[1] is not None]
 
         except Exception as e:
             logger.error(f"Failed to get shares for note {note_id}: {str(e)}")
             raise
 
+    def _apply_tag_filter(self, db_session: Session, query, tag_ids: List[UUID]):
+        """Restrict a notes query to notes having ALL of the given tags.
+
+        Args:
+            db_session (Session): Database session.
+            query: Base SQLAlchemy query on NoteORM.
+            tag_ids (List[UUID]): Tag IDs every returned note must have.
+
+        Returns:
+            Modified query with tag filtering applied.
+        """
+        # Aggregate on the narrow note_tags table only, keeping the outer
+        # notes query free of joins and grouping
+        tag_match_query = (
+            db_session.query(note_tags.c.note_id)
+            .filter(note_tags.c.tag_id.in_(tag_ids))
+            .group_by(note_tags.c.note_id)
+            .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
+        )
+        return query.filter(NoteORM.id.in_(tag_match_query))
+
+    def _fetch_page(
+        self, base_query, offset: int, limit: int
+    ) -> Tuple[List[Note], int]:
+        """Fetch one page of notes together with the total match count.
+
+        The page and the total come back from a single query using a
+        COUNT(*) OVER () window instead of a separate COUNT round-trip. Tags
+        of the whole page are loaded with one IN query rather than one lazy
+        load per note while converting to domain entities.
+
+        Args:
+            base_query: Filtered SQLAlchemy query on NoteORM.
+            offset (int): Number of matching notes to skip.
+            limit (int): Maximum number of notes to return.
+
+        Returns:
+            Tuple[List[Note], int]: Notes of the page and total count.
+        """
+        rows = (
+            base_query.add_columns(func.count().over().label("total_count"))
+            .options(selectinload(NoteORM.tags))
+            .order_by(NoteORM.updated_at.desc(), NoteORM.id.desc())
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+
+        if rows:
+            total_count = rows[0].total_count
+        elif offset:
+            # Page past the end: no row carries the window total
+            total_count = base_query.count()
+        else:
+            total_count = 0
+
+        # Convert to domain entities
+        notes = [self._orm_to_domain_entity(row[0]) for row in rows]
+
+        return notes, total_count
+
+    def _get_owned_note(
+        self, db_session: Session, note_id: UUID, owner_id: UUID
+    ) -> Optional[NoteORM]:
+        """Fetch a non-deleted note owned by the given user.
+
+        Args:
+            db_session (Session): Database session.
+            note_id (UUID): The ID of the note to fetch.
+            owner_id (UUID): The ID of the user who must own the note.
+
+        Returns:
+            Optional[NoteORM]: The note ORM object, or None if not found or not owned.
+        """
+        return db_session.execute(
+            _owned_note_stmt, {"note_id": note_id, "owner_id": owner_id}
+        ).scalar_one_or_none()
+
     def _orm_to_domain_entity(self, note_orm: NoteORM) -> Note:
         """Convert SQLAlchemy ORM object to domain entity."""
         # Convert tags
         tag_entities = []
         for tag_orm in note_orm.tags:
             # tag_orm.id is already a UUID object due to as_uuid=True
-            tag_entity = TagEntity(id=tag_orm.id, name=tag_orm.name)
+            tag_entity = TagEntity.get(tag_orm.id, tag_orm.name)
             tag_entities.append(tag_entity)
 
         return Note(
@@ -645,5 +677,4 @@ class SQLAlchemyNoteRepository(NoteRepository):
             created_at=note_orm.created_at,
             updated_at=note_orm.updated_at,
             is_deleted=note_orm.is_deleted,
-            search_vector=note_orm.search_vector,
         )
@@ -5,7 +5,7 @@ using SQLAlchemy for database operations.
 """
 
 import logging
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple
 from uuid import UUID
 
 from domain.entities.note import Note
@@ -15,12 +15,71 @@ from domain.repositories.search_repository import SearchRepository
 from infrastructure.models.associations import note_tags
 from infrastructure.models.note_orm import NoteORM
 from infrastructure.models.note_share_orm import NoteShareORM
-from sqlalchemy import distinct, func, or_
-from sqlalchemy.orm import Session
+from infrastructure.repositories.worker_thread import run_in_worker_thread
+from sqlalchemy import distinct, exists, func, lambda_stmt, or_, select, tuple_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql.lambdas import StatementLambdaElement
 
 logger = logging.getLogger(__name__)
 
 
+# Section filters use correlated EXISTS so the planner can pick (anti-)semi-joins
+# instead of hashing the whole shares set as it must for NOT IN
+
+
+def _filter_my_notes(
+    stmt: StatementLambdaElement, user_id: UUID
+) -> StatementLambdaElement:
+    """Keep personal notes of the user (owned and not shared by them)."""
+    stmt += lambda s: s.where(
+        NoteORM.owner_id == user_id,
+        ~NoteORM.is_deleted,
+        ~exists().where(
+            NoteShareORM.note_id == NoteORM.id,
+            NoteShareORM.shared_by_user_id == user_id,
+        ),
+    )
+    return stmt
+
+
+def _filter_shared_by_me(
+    stmt: StatementLambdaElement, user_id: UUID
+) -> StatementLambdaElement:
+    """Keep notes owned by the user that they shared with someone."""
+    stmt += lambda s: s.where(
+        NoteORM.owner_id == user_id,
+        ~NoteORM.is_deleted,
+        exists().where(
+            NoteShareORM.note_id == NoteORM.id,
+            NoteShareORM.shared_by_user_id == user_id,
+        ),
+    )
+    return stmt
+
+
+def _filter_shared_with_me(
+    stmt: StatementLambdaElement, user_id: UUID
+) -> StatementLambdaElement:
+    """Keep notes other users shared with the user."""
+    stmt += lambda s: s.where(
+        ~NoteORM.is_deleted,
+        exists().where(
+            NoteShareORM.note_id == NoteORM.id,
+            NoteShareORM.shared_with_user_id == user_id,
+        ),
+    )
+    return stmt
+
+
+_SECTION_FILTERS: Dict[
+    SearchSection, Callable[[StatementLambdaElement, UUID], StatementLambdaElement]
+] = {
+    SearchSection.MY_NOTES: _filter_my_notes,
+    SearchSection.SHARED_BY_ME: _filter_shared_by_me,
+    SearchSection.SHARED_WITH_ME: _filter_shared_with_me,
+}
+
+
 class SQLAlchemySearchRepository(SearchRepository):
     """SQLAlchemy implementation of the search repository.
 
@@ -29,10 +88,12 @@ class SQLAlchemySearchRepository(SearchRepository):
 
     NOTE: This repository does not store the session internally.
     Each method receives a fresh session to ensure proper transaction management
-    and avoid session leaks.
+    and avoid session leaks. The session is synchronous, so search runs in a
+    worker thread to keep the event loop free during queries.
     """
 
-    async def search_notes(
+    @run_in_worker_thread
+    def search_notes(
         self, db_session: Session, criteria: SearchCriteria
     ) -> Tuple[List[Note], int]:
         """Search for notes based on the provided criteria.
@@ -46,44 +107,76 @@ class SQLAlchemySearchRepository(SearchRepository):
 
         Returns:
             Tuple[List[Note], int]: A tuple containing:
-                - List of Note domain entities matching the criteria
+                - List of Note domain entities matching the criteria; keyset
+                  pages carry one extra note when a following page exists
                 - Total count of notes matching the criteria
 
         Raises:
             Exception: If search operation fails at the database level.
         """
         try:
-            # Build base query based on section
-            base_query = self._build_section_query(db_session, criteria)
-
-            # Apply tag filtering if provided
-            if criteria.has_tag_filter():
-                base_query = self._apply_tag_filter(
-                    db_session, base_query, criteria.tag_ids
+            # Tags for the whole page are loaded with one IN query instead of
+            # one lazy load per note
+            if criteria.after is None:
+                # Offset pagination: fetch the page and the total in one query
+                # using a COUNT(*) OVER () window
+                page_stmt = lambda_stmt(
+                    lambda: select(
+                        NoteORM, func.count().over().label("total_count")
+                    ).options(selectinload(NoteORM.tags))
                 )
-
-            # Apply text search if provided
-            if criteria.has_text_search():
-                base_query = self._apply_text_search(base_query, criteria.query)
-
-            # Get total count for pagination (before applying limit/offset)
-            count_query = base_query
-            if criteria.has_tag_filter():
-                # For count with tag filtering, we need to count distinct notes
-                total_count = (
-                    count_query.with_entities(func.count(distinct(NoteORM.id))).scalar()
-                    or 0
+            else:
+                page_stmt = lambda_stmt(
+                    lambda: select(NoteORM).options(selectinload(NoteORM.tags))
+                )
+            page_stmt = self._apply_search_filters(page_stmt, criteria)
+            if criteria.ranks_by_relevance():
+                # ts_rank_cd only scores rows the GIN index already matched;
+                # trigram-only matches rank 0 and fall back to recency
+                search_query = criteria.query
+                page_stmt += lambda s: s.order_by(
+                    func.ts_rank_cd(
+                        NoteORM.search_vector,
+                        func.websearch_to_tsquery("simple", search_query),
+                    ).desc(),
+                    NoteORM.updated_at.desc(),
+                    NoteORM.id.desc(),
                 )
             else:
-                total_count = count_query.count() or 0
-
-            # Apply pagination and ordering
-            note_orms = (
-                base_query.order_by(NoteORM.updated_at.desc())
-                .offset(criteria.offset)
-                .limit(criteria.limit)
-                .all()
-            )
+                page_stmt += lambda s: s.order_by(
+                    NoteORM.updated_at.desc(), NoteORM.id.desc()
+                )
+
+            limit = criteria.limit
+            if criteria.after is None:
+                offset = criteria.offset
+                page_stmt += lambda s: s.offset(offset).limit(limit)
+                rows = db_session.execute(page_stmt).all()
+                note_orms = [row[0] for row in rows]
+
+                if rows:
+                    total_count = rows[0].total_count
+                elif offset:
+                    # Page past the end: no row carries the window total
+                    total_count = self._count_matches(db_session, criteria)
+                else:
+                    total_count = 0
+            else:
+                # Keyset pagination: the total must cover all matches, so it is
+                # counted without the cursor filter
+                total_count = self._count_matches(db_session, criteria)
+                if not total_count:
+                    return [], 0
+
+                # One row past the page tells whether a following page exists
+                after_updated_at = criteria.after.updated_at
+                after_id = criteria.after.note_id
+                probe_limit = limit + 1
+                page_stmt += lambda s: s.where(
+                    tuple_(NoteORM.updated_at, NoteORM.id)
+                    < tuple_(after_updated_at, after_id)
+                ).limit(probe_limit)
+                note_orms = db_session.execute(page_stmt).scalars().all()
 
             # Convert ORM objects to domain entities
             notes = [self._convert_orm_to_domain(note_orm) for note_orm in note_orms]
@@ -99,105 +192,128 @@ class SQLAlchemySearchRepository(SearchRepository):
             logger.error(f"Search operation failed: {str(e)}")
             raise
 
-    def _build_section_query(self, db_session: Session, criteria: SearchCriteria):
-        """Build the base query based on the search section.
+    def _count_matches(self, db_session: Session, criteria: SearchCriteria) -> int:
+        """Count every note matching the criteria, ignoring pagination.
 
         Args:
             db_session: SQLAlchemy database session
-            criteria: Search criteria containing section information
+            criteria: Search criteria to count matches for
 
         Returns:
-            SQLAlchemy query object for the specified section
+            Total number of matching notes
         """
-        if criteria.section == SearchSection.MY_NOTES:
-            # Get notes shared by user (exclude these from personal notes)
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id).filter(
-                    NoteShareORM.shared_by_user_id == criteria.user_id
-                )
-            ).subquery()
+        count_stmt = lambda_stmt(lambda: select(func.count()).select_from(NoteORM))
+        count_stmt = self._apply_search_filters(count_stmt, criteria)
+        return db_session.execute(count_stmt).scalar_one() or 0
 
-            # Query only personal notes (not shared by user)
-            return db_session.query(NoteORM).filter(
-                NoteORM.owner_id == criteria.user_id,
-                ~NoteORM.is_deleted,
-                ~NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
-            )
+    def _apply_search_filters(
+        self, stmt: StatementLambdaElement, criteria: SearchCriteria
+    ) -> StatementLambdaElement:
+        """Apply the section, tag and text filters shared by page and count.
 
-        elif criteria.section == SearchSection.SHARED_BY_ME:
-            # Get notes that are owned by user AND shared
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id)
-                .filter(NoteShareORM.shared_by_user_id == criteria.user_id)
-                .subquery()
-            )
+        Each filter is appended as its own lambda so SQLAlchemy caches the
+        compiled SQL per combination of filters; only the bound values change
+        between requests.
 
-            return db_session.query(NoteORM).filter(
-                NoteORM.owner_id == criteria.user_id,
-                ~NoteORM.is_deleted,
-                NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
-            )
+        Args:
+            stmt: Lambda statement selecting from notes
+            criteria: Search criteria to filter by
 
-        elif criteria.section == SearchSection.SHARED_WITH_ME:
-            # Get notes shared with user (not owned by user)
-            shared_note_ids_subquery = (
-                db_session.query(NoteShareORM.note_id)
-                .filter(NoteShareORM.shared_with_user_id == criteria.user_id)
-                .subquery()
-            )
+        Returns:
+            The statement with all applicable filters appended
+        """
+        stmt = self._apply_section_filter(stmt, criteria)
 
-            return db_session.query(NoteORM).filter(
-                ~NoteORM.is_deleted,
-                NoteORM.id.in_(db_session.query(shared_note_ids_subquery.c.note_id)),
-            )
+        # Apply tag filtering if provided
+        if criteria.has_tag_filter():
+            stmt = self._apply_tag_filter(stmt, criteria.tag_ids)
 
-        else:
+        # Apply text search if provided
+        if criteria.has_text_search():
+            stmt = self._apply_text_search(stmt, criteria.query)
+
+        return stmt
+
+    def _apply_section_filter(
+        self, stmt: StatementLambdaElement, criteria: SearchCriteria
+    ) -> StatementLambdaElement:
+        """Restrict the statement to the notes of the search section.
+
+        Args:
+            stmt: Lambda statement selecting from notes
+            criteria: Search criteria containing section information
+
+        Returns:
+            The statement restricted to the requested section
+
+        Raises:
+            ValueError: If the section is not supported
+        """
+        section_filter = _SECTION_FILTERS.get(criteria.section)
+        if section_filter is None:
             raise ValueError(f"Unsupported search section: {criteria.section}")
 
-    def _apply_tag_filter(self, db_session: Session, query, tag_ids: List[UUID]):
-        """Apply tag filtering to the query using AND logic.
+        return section_filter(stmt, criteria.user_id)
+
+    def _apply_tag_filter(
+        self, stmt: StatementLambdaElement, tag_ids: List[UUID]
+    ) -> StatementLambdaElement:
+        """Apply tag filtering to the statement using AND logic.
 
         Args:
-            db_session: SQLAlchemy database session
-            query: Base SQLAlchemy query
+            stmt: Lambda statement selecting from notes
             tag_ids: List of tag UUIDs to filter by
 
         Returns:
-            Modified query with tag filtering applied
+            The statement with tag filtering applied
         """
-        # Join with note_tags and group by note to ensure the note has ALL selected tags
-        return (
-            query.join(note_tags)
-            .filter(note_tags.c.tag_id.in_(tag_ids))
-            .group_by(NoteORM.id)
-            .having(func.count(distinct(note_tags.c.tag_id)) == len(tag_ids))
+        # Aggregate on the narrow note_tags table only, keeping the outer
+        # notes query free of joins and grouping
+        tag_count = len(tag_ids)
+        stmt += lambda s: s.where(
+            NoteORM.id.in_(
+                select(note_tags.c.note_id)
+                .where(note_tags.c.tag_id.in_(tag_ids))
+                .group_by(note_tags.c.note_id)
+                .having(func.count(distinct(note_tags.c.tag_id)) == tag_count)
+            )
         )
+        return stmt
+
+    def _apply_text_search(
+        self, stmt: StatementLambdaElement, search_query: str
+    ) -> StatementLambdaElement:
+        """Apply text search to the statement using PostgreSQL full-text search.
+
+        The query is parsed once by ``websearch_to_tsquery``, so users get web
+        search syntax: ``"quoted phrases"``, ``OR`` between terms and ``-term``
+        to exclude a word; plain words are ANDed. It never raises on malformed
+        input.
 
-    def _apply_text_search(self, query, search_query: str):
-        """Apply text search to the query using PostgreSQL full-text search.
+        Full-text matches are complemented by a trigram word-similarity
+        fallback so partial words (e.g. "wor" for "work") still match. Every
+        branch is backed by a GIN index, letting the planner combine them with
+        a bitmap OR instead of a sequential scan.
 
         Args:
-            query: Base SQLAlchemy query
+            stmt: Lambda statement selecting from notes
             search_query: Text query for searching
 
         Returns:
-            Modified query with text search applied
+            The statement with text search applied
         """
-        search_pattern = f"%{search_query}%"
-
-        # Full-text search condition
-        fulltext_condition = NoteORM.search_vector.op("@@")(
-            func.plainto_tsquery("simple", search_query)
-        )
-
-        # Substring search condition (case-insensitive)
-        substring_condition = or_(
-            NoteORM.title.ilike(search_pattern), NoteORM.content.ilike(search_pattern)
+        stmt += lambda s: s.where(
+            or_(
+                # Full-text search condition (GIN index on search_vector)
+                NoteORM.search_vector.op("@@")(
+                    func.websearch_to_tsquery("simple", search_query)
+                ),
+                # Fuzzy substring condition (GIN trigram indexes on title/content)
+                NoteORM.title.op("%>")(search_query),
+                NoteORM.content.op("%>")(search_query),
+            )
         )
-
-        # Combine both conditions with OR
-        search_condition = or_(fulltext_condition, substring_condition)
-        return query.filter(search_condition)
+        return stmt
 
     def _convert_orm_to_domain(self, note_orm: NoteORM) -> Note:
         """Convert a NoteORM object to a Note domain entity.
@@ -209,7 +325,7 @@ class SQLAlchemySearchRepository(SearchRepository):
             Note domain entity
         """
         # Convert associated tags to domain entities
-        tag_entities = [TagEntity(id=tag.id, name=tag.name) for tag in note_orm.tags]
+        tag_entities = [TagEntity.get(tag.id, tag.name) for tag in note_orm.tags]
 
         return Note(
             id=note_orm.id,  # Already a UUID object
@@ -220,7 +336,4 @@ class SQLAlchemySearchRepository(SearchRepository):
             created_at=note_orm.created_at,
             updated_at=note_orm.updated_at,
             is_deleted=note_orm.is_deleted,
-            search_vector=str(note_orm.search_vector)
-            if note_orm.search_vector
-            else None,
         )
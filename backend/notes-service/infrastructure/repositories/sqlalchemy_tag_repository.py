@@ -9,6 +9,8 @@ from typing import List
 from domain.entities.tag import TagEntity
 from domain.repositories.tag_repository import TagRepository
 from infrastructure.models.tag_orm import TagORM
+from infrastructure.repositories.worker_thread import run_in_worker_thread
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 
@@ -31,16 +33,18 @@ class SqlAlchemyTagRepository(TagRepository):
         5
     """
 
-    async def get_all(self, db_session: Session) -> List[TagEntity]:
+    @run_in_worker_thread
+    def get_all(self, db_session: Session) -> List[TagEntity]:
         """Retrieve all tags from the database.
 
         Args:
             db_session (Session): Fresh SQLAlchemy database session for this operation.
 
         Returns:
-            List[TagEntity]: List of all available tag entities.
+            List[TagEntity]: List of all available tag entities sorted by name.
         """
-        tag_models = db_session.query(TagORM).all()
+        # Case-insensitive order is served by the lower(name) index
+        tag_models = db_session.query(TagORM).order_by(func.lower(TagORM.name)).all()
         return [self._model_to_entity(model) for model in tag_models]
 
     def _model_to_entity(self, tag_model: TagORM) -> TagEntity:
@@ -52,4 +56,4 @@ class SqlAlchemyTagRepository(TagRepository):
         Returns:
             TagEntity: Corresponding domain entity.
         """
-        return TagEntity(id=tag_model.id, name=tag_model.name)
+        return TagEntity.get(tag_model.id, tag_model.name)
@@ -0,0 +1,40 @@
+"""Worker thread helper for the synchronous SQLAlchemy repositories.
+
+The repositories use a synchronous Session behind async interfaces. Running
+their database work in a worker thread keeps the event loop free to serve
+other requests while a query waits on PostgreSQL.
+"""
+
+import asyncio
+import functools
+from typing import Awaitable, Callable, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+
+def run_in_worker_thread(func: Callable[P, R]) -> Callable[P, Awaitable[R]]:
+    """Turn a blocking repository method into an awaitable one.
+
+    A request's session is only ever used by one call at a time, so handing
+    it to a worker thread for the duration of the call is safe.
+
+    Args:
+        func (Callable[P, R]): Blocking function to run off the event loop.
+
+    Returns:
+        Callable[P, Awaitable[R]]: Coroutine function running func through
+            asyncio.to_thread.
+
+    Example:
+        >>> class SQLAlchemyNoteRepository(NoteRepository):
+        ...     @run_in_worker_thread
+        ...     def get_note_by_id(self, db_session, note_id, user_id):
+        ...         ...
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+    return wrapper
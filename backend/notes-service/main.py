@@ -1,14 +1,53 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
+from application.rest.responses import ORJSONResponse
+from application.rest.schemas.output.common_output import ErrorResponse, HealthResponse
+from application.rest.schemas.output.note_output import (
+    NoteResponse,
+    NotesListResponse,
+    PaginationInfo,
+)
+from application.rest.schemas.output.search_output import SearchResultResponse
+from application.rest.schemas.output.share_output import (
+    NoteSharesResponse,
+    ShareResponse,
+)
+from application.rest.schemas.output.tag_output import TagResponse
 from application.rest.routers.router_health import router as health_router
 from application.rest.routers.router_tags import router as tags_router
 from application.rest.routers.router_search import router as search_router
 from application.rest.routers.router_notes import router as notes_router
 
+# Response schemas are declared with defer_build; their pydantic-core schemas
+# are built once at startup instead of on the first request that needs them
+RESPONSE_MODELS = (
+    TagResponse,
+    NoteResponse,
+    PaginationInfo,
+    NotesListResponse,
+    SearchResultResponse,
+    ShareResponse,
+    NoteSharesResponse,
+    ErrorResponse,
+    HealthResponse,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    for model in RESPONSE_MODELS:
+        model.model_rebuild()
+    yield
+
+
 app = FastAPI(
     title="SharedNotes Notes Service",
     description="Notes management service for SharedNotes",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.include_router(health_router)
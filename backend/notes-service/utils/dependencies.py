@@ -5,7 +5,7 @@ including database session management and user authentication utilities.
 
 Functions:
     - get_db: Database session factory with automatic cleanup
-    - get_current_user_id: Extract user ID from request headers
+    - get_current_user_id: Extract user ID from request headers (cached per request)
 
 Architecture:
     These utilities are shared across all layers and provide clean dependency
@@ -20,6 +20,7 @@ from domain.services.note_service import NoteService
 from domain.services.search_service import SearchService
 from domain.services.tag_service import TagService
 from fastapi import HTTPException, Request
+from infrastructure.repositories.cached_tag_repository import CachedTagRepository
 from infrastructure.repositories.sqlalchemy_note_repository import (
     SQLAlchemyNoteRepository,
 )
@@ -31,16 +32,39 @@ from infrastructure.repositories.sqlalchemy_tag_repository import (
 )
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
-from utils.config import DATABASE_URL, LOG_LEVEL
+from utils.config import (
+    DATABASE_URL,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE_SECONDS,
+    DB_POOL_SIZE,
+    DB_QUERY_CACHE_SIZE,
+    LOG_LEVEL,
+    TAGS_CACHE_TTL_SECONDS,
+)
 
 # Configure logging
 logging.basicConfig(level=getattr(logging, LOG_LEVEL))
 logger = logging.getLogger(__name__)
 
 # Database setup
-engine = create_engine(DATABASE_URL)
+# Sessions check connections out of a bounded pool instead of connecting per
+# request; stale connections are detected before use and recycled periodically
+engine = create_engine(
+    DATABASE_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE_SECONDS,
+    query_cache_size=DB_QUERY_CACHE_SIZE,
+    echo=False,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Shared across requests so the tag list cache outlives a single request
+_tag_repository = CachedTagRepository(
+    SqlAlchemyTagRepository(), ttl=TAGS_CACHE_TTL_SECONDS
+)
+
 
 def get_db() -> Generator[Session, None, None]:
     """Get database session with automatic cleanup.
@@ -62,6 +86,9 @@ def get_db() -> Generator[Session, None, None]:
 def get_current_user_id(request: Request) -> UUID:
     """Extract user ID from request headers.
 
+    The parsed UUID is cached on ``request.state`` so that repeated lookups
+    within the same request (dependencies, handlers) skip header parsing.
+
     Args:
         request (Request): FastAPI request object containing headers.
 
@@ -77,15 +104,22 @@ def get_current_user_id(request: Request) -> UUID:
         >>> print(user_id)
         UUID('keycloak-user-uuid')
     """
+    cached_user_id = getattr(request.state, "user_id", None)
+    if cached_user_id is not None:
+        return cached_user_id
+
     user_id_str = request.headers.get("X-User-ID")
     if not user_id_str:
         raise HTTPException(status_code=401, detail="User ID not found in headers")
 
     try:
-        return UUID(user_id_str)
+        user_id = UUID(user_id_str)
     except ValueError:
         raise HTTPException(status_code=400, detail="Invalid user ID format")
 
+    request.state.user_id = user_id
+    return user_id
+
 
 def get_tag_service() -> TagService:
     """Create and configure the tag service with repository dependency.
@@ -96,11 +130,9 @@ def get_tag_service() -> TagService:
     Returns:
         TagService: Configured domain service ready for use.
     """
-    # Infrastructure layer: SQLAlchemy repository (no session stored)
-    tag_repository = SqlAlchemyTagRepository()
-
+    # Infrastructure layer: cached SQLAlchemy repository (no session stored)
     # Domain layer: Domain service with business logic
-    return TagService(tag_repository)
+    return TagService(_tag_repository)
 
 
 def get_search_service() -> SearchService:
@@ -6,14 +6,16 @@ and management operations, including fetching user details by ID or email.
 Functions:
     - get_user_email_by_id: Fetch user email from Keycloak by user ID
     - get_user_id_by_email: Find user ID in Keycloak by email address
+    - get_user_emails_by_ids: Fetch the emails of several users in one batch
 
 Architecture:
     Keycloak integration is separated from other dependencies to follow
     single responsibility principle and make testing easier.
 """
 
+import asyncio
 import logging
-from typing import Optional
+from typing import List, Optional
 
 import httpx
 from utils.config import (
@@ -26,6 +28,33 @@ from utils.config import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of user lookups in flight against Keycloak per batch
+USER_LOOKUP_CONCURRENCY = 10
+
+
+async def _get_admin_token(client: httpx.AsyncClient) -> Optional[str]:
+    """Request an admin access token from the Keycloak master realm.
+
+    Args:
+        client (httpx.AsyncClient): HTTP client used for the request.
+
+    Returns:
+        str: Admin access token or None if the token request failed.
+    """
+    admin_token_url = f"{KEYCLOAK_URL}/realms/master/protocol/openid-connect/token"
+    admin_token_data = {
+        "grant_type": "password",
+        "client_id": KEYCLOAK_ADMIN_CLIENT_ID,
+        "username": KEYCLOAK_ADMIN_USERNAME,
+        "password": KEYCLOAK_ADMIN_PASSWORD,
+    }
+
+    response = await client.post(admin_token_url, data=admin_token_data)
+    if response.status_code == 200:
+        return response.json()["access_token"]
+    logger.error(f"Failed to get admin token: {response.status_code}")
+    return None
+
 
 async def get_user_email_by_id(user_id: str) -> Optional[str]:
     """Get user email by ID from Keycloak.
@@ -45,21 +74,9 @@ async def get_user_email_by_id(user_id: str) -> Optional[str]:
         "user@example.com"
     """
     try:
-        # Get admin token
-        admin_token_url = f"{KEYCLOAK_URL}/realms/master/protocol/openid-connect/token"
-        admin_token_data = {
-            "grant_type": "password",
-            "client_id": KEYCLOAK_ADMIN_CLIENT_ID,
-            "username": KEYCLOAK_ADMIN_USERNAME,
-            "password": KEYCLOAK_ADMIN_PASSWORD,
-        }
-
         async with httpx.AsyncClient() as client:
-            response = await client.post(admin_token_url, data=admin_token_data)
-            if response.status_code == 200:
-                admin_token = response.json()["access_token"]
-            else:
-                logger.error(f"Failed to get admin token: {response.status_code}")
+            admin_token = await _get_admin_token(client)
+            if admin_token is None:
                 return None
 
             # Get user data
@@ -96,21 +113,9 @@ async def get_user_id_by_email(email: str) -> Optional[str]:
         "keycloak-user-uuid"
     """
     try:
-        # Get admin token first
-        admin_token_url = f"{KEYCLOAK_URL}/realms/master/protocol/openid-connect/token"
-        admin_token_data = {
-            "grant_type": "password",
-            "client_id": KEYCLOAK_ADMIN_CLIENT_ID,
-            "username": KEYCLOAK_ADMIN_USERNAME,
-            "password": KEYCLOAK_ADMIN_PASSWORD,
-        }
-
         async with httpx.AsyncClient() as client:
-            response = await client.post(admin_token_url, data=admin_token_data)
-            if response.status_code == 200:
-                admin_token = response.json()["access_token"]
-            else:
-                logger.error(f"Failed to get admin token: {response.status_code}")
+            admin_token = await _get_admin_token(client)
+            if admin_token is None:
                 return None
 
             # Search user by email
@@ -132,3 +137,57 @@ async def get_user_id_by_email(email: str) -> Optional[str]:
     except Exception as e:
         logger.error(f"Error getting user ID for email {email}: {e}")
         return None
+
+
+async def get_user_emails_by_ids(user_ids: List[str]) -> List[Optional[str]]:
+    """Get the emails of several users by ID from Keycloak.
+
+    One admin token and one HTTP client are shared by the whole batch, and at
+    most USER_LOOKUP_CONCURRENCY user lookups run at the same time.
+
+    Args:
+        user_ids (List[str]): Keycloak user UUIDs.
+
+    Returns:
+        List[Optional[str]]: Email addresses in input order; None for users
+        whose email could not be fetched.
+
+    Raises:
+        Exception: Logs errors but doesn't raise, returns None on failure.
+
+    Example:
+        >>> emails = await get_user_emails_by_ids(["uuid-1", "uuid-2"])
+        >>> print(emails)
+        ["first@example.com", "second@example.com"]
+    """
+    if not user_ids:
+        return []
+
+    try:
+        async with httpx.AsyncClient() as client:
+            admin_token = await _get_admin_token(client)
+            if admin_token is None:
+                return [None] * len(user_ids)
+
+            headers = {"Authorization": f"Bearer {admin_token}"}
+            semaphore = asyncio.Semaphore(USER_LOOKUP_CONCURRENCY)
+
+            async def get_email(user_id: str) -> Optional[str]:
+                user_url = (
+                    f"{KEYCLOAK_URL}/admin/realms/{KEYCLOAK_REALM}/users/{user_id}"
+                )
+                try:
+                    async with semaphore:
+                        response = await client.get(user_url, headers=headers)
+                    if response.status_code == 200:
+                        return response.json().get("email")
+                    logger.error(f"Failed to get user data: {response.status_code}")
+                    return None
+                except Exception as e:
+                    logger.error(f"Error getting user email for ID {user_id}: {e}")
+                    return None
+
+            return await asyncio.gather(*(get_email(user_id) for user_id in user_ids))
+    except Exception as e:
+        logger.error(f"Error getting user emails for {len(user_ids)} users: {e}")
+        return [None] * len(user_ids)
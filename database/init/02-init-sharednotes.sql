@@ -1,6 +1,9 @@
 -- Database initialization script for SharedNotes application
 -- Make sure the 'sharednotes' database is already created (via POSTGRES_DB)
 
+-- Trigram support for indexed substring search on title/content
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Notes table with UUID primary key and Keycloak UUID as owner
 CREATE TABLE IF NOT EXISTS notes (
     id UUID PRIMARY KEY DEFAULT gen_random_uuid(),
@@ -10,7 +13,11 @@ CREATE TABLE IF NOT EXISTS notes (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     is_deleted BOOLEAN DEFAULT FALSE,
-    search_vector tsvector
+    -- Full-text search vector, maintained by PostgreSQL from title and content
+    search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', COALESCE(title, '')), 'A') ||
+        setweight(to_tsvector('simple', COALESCE(content, '')), 'B')
+    ) STORED
 );
 
 -- Tags table with UUID primary key
@@ -48,13 +55,20 @@ CREATE TABLE IF NOT EXISTS note_shares (
 );
 
 -- Indexes for better performance
-CREATE INDEX IF NOT EXISTS idx_notes_owner_id ON notes(owner_id);
+-- Partial: every owner-scoped query also filters on NOT is_deleted
+CREATE INDEX IF NOT EXISTS idx_notes_owner_updated_at_id ON notes(owner_id, updated_at DESC, id DESC) WHERE NOT is_deleted;
 CREATE INDEX IF NOT EXISTS idx_notes_created_at ON notes(created_at);
+CREATE INDEX IF NOT EXISTS idx_notes_updated_at_id ON notes(updated_at DESC, id DESC);
 CREATE INDEX IF NOT EXISTS idx_notes_search_vector ON notes USING GIN(search_vector);
+CREATE INDEX IF NOT EXISTS idx_notes_title_trgm ON notes USING GIN(title gin_trgm_ops);
+CREATE INDEX IF NOT EXISTS idx_notes_content_trgm ON notes USING GIN(content gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_note_shares_note_id ON note_shares(note_id);
-CREATE INDEX IF NOT EXISTS idx_note_shares_shared_with_user_id ON note_shares(shared_with_user_id);
+CREATE INDEX IF NOT EXISTS idx_note_shares_shared_by_user_id_note_id ON note_shares(shared_by_user_id, note_id);
+CREATE INDEX IF NOT EXISTS idx_note_shares_shared_with_user_id_note_id ON note_shares(shared_with_user_id, note_id);
 CREATE INDEX IF NOT EXISTS idx_note_tags_note_id ON note_tags(note_id);
-CREATE INDEX IF NOT EXISTS idx_note_tags_tag_id ON note_tags(tag_id);
+CREATE INDEX IF NOT EXISTS idx_note_tags_tag_id_note_id ON note_tags(tag_id, note_id);
+-- Matches the case-insensitive ORDER BY of the tag list
+CREATE INDEX IF NOT EXISTS idx_tags_lower_name ON tags(lower(name));
 
 -- Function to update the updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -65,20 +79,7 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
--- Function to update search_vector for full-text search
-CREATE OR REPLACE FUNCTION update_notes_search_vector()
-RETURNS TRIGGER AS $$
-BEGIN
-    NEW.search_vector := setweight(to_tsvector('simple', COALESCE(NEW.title, '')), 'A');
-    RETURN NEW;
-END;
-$$ language 'plpgsql';
-
 -- Trigger for updated_at
 CREATE TRIGGER update_notes_updated_at BEFORE UPDATE ON notes
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
--- Trigger for search_vector (fires on INSERT and UPDATE)
-CREATE TRIGGER update_notes_search_vector_trigger 
-    BEFORE INSERT OR UPDATE ON notes
-    EXECUTE FUNCTION update_notes_search_vector();